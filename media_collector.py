@@ -15,19 +15,130 @@ os.environ['PYTHONDONTWRITEBYTECODE'] = '1'
 
 import os
 import re
-import xml.etree.ElementTree as ET
-from xml.etree.ElementTree import ParseError
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 import argparse
+import copy
+import functools
+import json
+import multiprocessing
+import string
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import yaml
 import logging
-import html
+import logging.handlers
+
+# NFO解析器（修复版）
+from nfo_parser_fixed import FixedNFOParser as NFOParser
+
+# 优先使用libyaml的C实现解析YAML，不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# 日期字符串中的四位年份
+_YEAR_RE = re.compile(r'(\d{4})')
+
+
+class _FirstMatch:
+    """把按优先级排列的多个正则合并为一个正则，一次匹配完成查找
+
+    结果与依次对每个正则调用search、取第一个命中正则的最左匹配完全一致：
+    合并形式为 ^(?:.*?(P1)|.*?(P2)|...)，只有P1在整个字符串中都不匹配时才会尝试P2。
+    """
+
+    def __init__(self, patterns, flags: int = 0):
+        parts = []
+        self._groups = {}
+        index = 0
+        for i, pattern in enumerate(patterns):
+            name = f'_p{i}'
+            inner_groups = re.compile(pattern, flags).groups
+            index += 1
+            # 原正则有捕获组时取其第一个捕获组，否则取整个匹配
+            self._groups[name] = index + 1 if inner_groups else index
+            index += inner_groups
+            parts.append(f'.*?(?P<{name}>{pattern})')
+        self._regex = re.compile('^(?:' + '|'.join(parts) + ')', flags | re.DOTALL)
+
+    def search(self, text: str) -> Optional[str]:
+        """返回第一个命中正则的第一个捕获组文本，都不匹配时返回None"""
+        match = self._regex.match(text)
+        if match:
+            return match.group(self._groups[match.lastgroup])
+        return None
+
+
+# 文件名中的文件类型后缀
+_FILETYPE_MATCHER = _FirstMatch([
+    r'[A-Z]+-\d+-([A-Z])\.',     # EDRG-009-F -> F
+    r'[A-Z]+-\d+-([A-Z]+)\.',    # EDRG-009-TRAILER -> TRAILER
+    r'[A-Z]+-\d+-thumb\.',       # 缩略图
+    r'[A-Z]+-\d+-trailer\.',     # 预告片
+], re.IGNORECASE)
+
+# 日志级别名称到数值的映射
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# 日志是否已配置（每个进程只配置一次）
+_LOGGING_CONFIGURED = False
+
+# 不生成页面的演员名和分类值
+_BLOCKED_ACTORS = frozenset({"未知演员", ""})
+_BLOCKED_CATEGORIES = frozenset({"", "未知", None})
+
+# YAML双引号转义表：反斜杠和双引号，一次translate完成
+_YAML_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """解析YAML文件，按(路径, 修改时间, 文件大小)缓存结果
+
+    解析结果连同YAML文件的修改时间和大小写入同目录的 <配置文件>.cache.json，
+    下次启动时两者与当前YAML完全一致才直接读取，跳过YAML解析；
+    缓存损坏、不可写或配置含JSON无法表示的值时回退到YAML。
+    """
+    cache_path = path + '.cache.json'
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] == mtime_ns and cached['size'] == size:
+            return cached['config']
+    except Exception:
+        pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+
+    try:
+        # 只有JSON往返后内容不变（无日期、非字符串键等）时才写缓存
+        text = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'config': config}, ensure_ascii=False)
+        if json.loads(text)['config'] == config:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+    except Exception as e:
+        logging.debug(f"无法写入配置缓存 {cache_path}: {e}")
+
+    return config
 
 
-@dataclass
+# Python 3.10+ 使用slots数据类，减少每个实例的内存占用
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MediaInfo:
     """媒体文件信息数据类"""
     code: str  # 番号
@@ -46,7 +157,9 @@ class MediaInfo:
     fanart_path: str = ""
     video_path: str = ""
     trailer_path: str = ""
+    trailer_size: Optional[int] = None  # 扫描时从目录项取得的trailer大小
     nfo_path: str = ""
+    nfo_data: Optional[dict] = None  # NFO解析结果缓存
 
     def __post_init__(self):
         if self.actors is None:
@@ -55,20 +168,118 @@ class MediaInfo:
             self.genre = []
 
 
+def load_nfo_data(media_info: MediaInfo, nfo_parser) -> dict:
+    """获取媒体的NFO解析结果，每个NFO文件只解析一次并缓存在media_info上"""
+    if media_info.nfo_data is None:
+        # 扫描后文件可能已被删除，或是失效的符号链接；不存在时与无NFO一样返回空结果
+        if media_info.nfo_path and os.path.exists(media_info.nfo_path):
+            media_info.nfo_data = nfo_parser.parse_nfo(media_info.nfo_path)
+        else:
+            media_info.nfo_data = {}
+    return media_info.nfo_data
+
+
+# 媒体数量达到该值时才启用进程池，数量较少时进程启动开销得不偿失
+_PARALLEL_THRESHOLD = 32
+
+# 等待写入磁盘的Markdown页面上限，生成快于写入时生成端在此阻塞，避免内容全部堆积在内存中
+_WRITE_QUEUE_SIZE = 64
+
+# 进程池工作进程内的Markdown生成器
+_worker_generator = None
+
+
+def _init_markdown_worker(generator, log_queue, log_level: int):
+    """进程池初始化：每个工作进程持有一份主进程的Markdown生成器（含NFO解析器）
+
+    工作进程的日志全部经队列交给主进程的处理器输出（spawn启动的进程没有日志配置，
+    fork继承的处理器也不再直接使用），格式和日志文件与主进程一致
+    """
+    global _worker_generator, _LOGGING_CONFIGURED
+    _worker_generator = generator
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+    _LOGGING_CONFIGURED = True
+
+
+def _generate_markdown_worker(media_info: MediaInfo) -> Tuple[dict, str]:
+    """在工作进程中解析NFO并生成Markdown内容，NFO解析结果一并返回给主进程缓存"""
+    content = _worker_generator.generate_markdown(media_info)
+    return media_info.nfo_data, content
+
+
+def generate_markdown_files(media_groups: Dict[str, MediaInfo], generator, config):
+    """生成并保存所有媒体的Markdown文件，媒体较多时用进程池并行解析NFO、生成内容
+
+    写文件交给单独的写入线程，生成下一篇内容时上一篇的磁盘写入同时进行；
+    待写入的页面最多_WRITE_QUEUE_SIZE篇，写入完成的页面随即释放
+    """
+    items = list(media_groups.values())
+    done = 0
+    write_slots = threading.BoundedSemaphore(_WRITE_QUEUE_SIZE)
+    write_errors = []
+
+    def on_written(future):
+        write_slots.release()
+        if future.exception() is not None:
+            write_errors.append(future.exception())
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        def submit_write(media_info, content):
+            write_slots.acquire()
+            writer.submit(generator.save_markdown, media_info, content).add_done_callback(on_written)
+
+        if len(items) >= _PARALLEL_THRESHOLD:
+            max_workers = config.get('advanced.max_workers', None)
+            # 主进程监听工作进程发来的日志记录，交给当前的日志处理器
+            root = logging.getLogger()
+            log_queue = multiprocessing.Queue()
+            log_listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+            log_listener.start()
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_markdown_worker,
+                                         initargs=(generator, log_queue, root.level)) as executor:
+                    results = executor.map(_generate_markdown_worker, items, chunksize=64)
+                    for media_info, (nfo_data, content) in zip(items, results):
+                        logging.info("正在处理: %s", media_info.code)
+                        media_info.nfo_data = nfo_data
+                        submit_write(media_info, content)
+                        done += 1
+            except Exception as e:
+                # 未完成的媒体改为在主进程中逐个生成
+                logging.warning(f"并行生成Markdown失败，改为逐个生成: {e}")
+            finally:
+                # 工作进程已全部退出，处理完队列中剩余的记录后停止监听
+                log_listener.stop()
+
+        for media_info in items[done:]:
+            logging.info("正在处理: %s", media_info.code)
+            content = generator.generate_markdown(media_info)
+            submit_write(media_info, content)
+
+    # 写入线程已处理完全部页面，写入失败时把第一个异常抛给调用方
+    if write_errors:
+        raise write_errors[0]
+
+
 class Config:
     """配置管理类"""
 
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = config_file
         self.config = self.load_config()
+        self._flat = self._flatten(self.config)
         self.setup_logging()
 
     def load_config(self) -> dict:
         """加载配置文件"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                # 同一进程内多次构造Config时复用解析结果，返回副本避免调用方修改缓存
+                abs_path = os.path.abspath(self.config_file)
+                st = os.stat(abs_path)
+                config = copy.deepcopy(_load_yaml_cached(abs_path, st.st_mtime_ns, st.st_size))
                 logging.info(f"配置文件加载成功: {self.config_file}")
                 return config
             else:
@@ -113,6 +324,10 @@ class Config:
 
     def setup_logging(self):
         """设置日志"""
+        global _LOGGING_CONFIGURED
+        if _LOGGING_CONFIGURED:
+            return
+
         log_level = self.config.get('advanced.log_level', 'INFO')
         enable_file_logging = self.config.get('advanced.logging.enable_file_logging', False)  # 默认禁用文件日志
         log_file_path = self.config.get('advanced.logging.log_file_path', 'media_collector.log')
@@ -120,6 +335,8 @@ class Config:
         # 禁用所有logger的传播，只使用根logger
         logging.getLogger().handlers.clear()
 
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+
         # 设置处理器列表
         handlers = [logging.StreamHandler()]
 
@@ -127,15 +344,17 @@ class Config:
         if enable_file_logging:
             try:
                 file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-                handlers.append(file_handler)
+                file_handler.setFormatter(logging.Formatter(log_format))
+                # 文件日志批量写入：每1000条或遇到错误时刷新一次，退出时自动刷新剩余记录
+                handlers.append(logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler))
             except Exception as e:
                 # 如果文件处理器创建失败，只使用控制台输出
                 print(f"警告：无法创建日志文件 {log_file_path}: {e}")
 
         # 配置日志
         logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            level=_LOG_LEVELS.get(log_level, logging.INFO),
+            format=log_format,
             handlers=handlers,
             force=True  # 强制重新配置
         )
@@ -145,94 +364,56 @@ class Config:
             logger = logging.getLogger(name)
             logger.propagate = False
 
-    def get(self, key_path: str, default=None):
-        """获取配置值，支持点分隔的路径"""
-        keys = key_path.split('.')
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        _LOGGING_CONFIGURED = True
 
+        # 日志配置完成后再提示，否则用户看不到
+        if YamlLoader is yaml.SafeLoader:
+            logging.warning("PyYAML未启用libyaml C扩展，配置文件使用纯Python解析器加载，速度较慢")
 
-class ActorPageGenerator:
-    """演员页面生成器"""
+    def _flatten(self, d, prefix: str = '') -> dict:
+        """将嵌套配置展开为以点分隔路径为键的平铺字典（包含中间节点）"""
+        flat = {}
+        if not isinstance(d, dict):
+            return flat
+        for key, value in d.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+        return flat
 
-    def __init__(self, config: Config):
-        self.config = config
-        self.actor_dir = Path(config.get('paths.output_directory', 'obsidian_output')).parent / 'actor'
-        self.actor_dir.mkdir(exist_ok=True)
-
-    def generate_actor_pages(self, media_groups: Dict[str, MediaInfo]):
-        """为所有演员生成页面"""
-        # 收集所有演员和他们的作品
-        actor_works = {}
-
-        for code, media_info in media_groups.items():
-            # 解析NFO文件获取演员信息
-            actors = self._get_actors_from_media(media_info)
-            for actor in actors:
-                if actor not in ["未知演员", ""]:
-                    if actor not in actor_works:
-                        actor_works[actor] = []
-                    actor_works[actor].append(media_info)
-
-        # 为每个演员生成页面
-        for actor, works in actor_works.items():
-            self._generate_actor_page(actor, works)
-
-        logging.info(f"已生成 {len(actor_works)} 个演员页面")
-
-    def _get_actors_from_media(self, media_info: MediaInfo) -> List[str]:
-        """从媒体信息中获取演员列表"""
-        actors = []
-
-        # 如果有NFO文件，解析获取演员
-        if media_info.nfo_path and os.path.exists(media_info.nfo_path):
-            try:
-                nfo_parser = NFOParser(self.config)
-                nfo_data = nfo_parser.parse_nfo(media_info.nfo_path)
-                nfo_actors = nfo_data.get('actors', [])
-                if nfo_actors:
-                    actors.extend(nfo_actors)
-            except Exception as e:
-                logging.warning(f"解析NFO文件获取演员信息失败: {e}")
-
-        # 如果NFO解析失败，使用media_info中的演员
-        if not actors and media_info.actors:
-            actors = media_info.actors
-
-        return actors
-
-    def _generate_actor_page(self, actor: str, works: List[MediaInfo]):
-        """生成单个演员页面"""
-        actor_file = self.actor_dir / f"{actor}.md"
-
-        # 生成页面内容
-        content = self._generate_actor_content(actor, works)
-
-        # 写入文件
-        with open(actor_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        logging.info(f"已生成演员页面: {actor_file}")
-
-    def _generate_actor_content(self, actor: str, works: List[MediaInfo]) -> str:
-        """生成演员页面内容 - 基于preview.md的样式"""
+    def get(self, key_path: str, default=None):
+        """获取配置值，支持点分隔的路径"""
+        return self._flat.get(key_path, default)
 
-        # 获取配置路径
-        root_dir = self.config.get('dataview.root_dir', 'jav_store/source')
-        actor_dir = f'{root_dir}/actor'
-        years_dir = f'{root_dir}/years'
-        ranks_dir = f'{root_dir}/ranks'
-        keywords_dir = f'{root_dir}/keywords'
+    def set(self, key_path: str, value):
+        """设置配置值，支持点分隔的路径，并同步更新平铺查找表"""
+        keys = key_path.split('.')
+        node = self.config
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[keys[-1]] = value
+        self._flat = self._flatten(self.config)
+
+
+def _write_text_file(path, content: str):
+    """一次性编码后用单次os.write写入文件"""
+    data = content.encode('utf-8')
+    # 与open()一致：新建文件的权限为0o666再由umask裁剪
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-        # 按番号排序作品
-        works_sorted = sorted(works, key=lambda x: x.code)
 
-        content = f"""---
+# 演员页面头部，__ACTOR_NAME__ 为演员名占位符
+_ACTOR_PAGE_HEADER = """---
 cssclasses:
   - cards-cols-6
   - cards-cover
@@ -240,44 +421,47 @@ cssclasses:
   - cards
 ---
 
-# 👰 演员: {actor}
+# 👰 演员: __ACTOR_NAME__
 
 ```dataviewjs
 
 // === 演员专属页面配置 ===
-const ACTOR_NAME = "{actor}";
+const ACTOR_NAME = "__ACTOR_NAME__";
 const ROOT = "jav_store";
-const META_DIR = `${{ROOT}}/films`;
-const COVER_DIR = `${{ROOT}}/source`;
+const META_DIR = `${ROOT}/films`;
+const COVER_DIR = `${ROOT}/source`;
 
 // 分类目录常量
-const ACTOR_DIR = `${{ROOT}}/actor`;
-const YEARS_DIR = `${{ROOT}}/years`;
-const RANKS_DIR = `${{ROOT}}/ranks`;
-const SERIES_DIR = `${{ROOT}}/series`;
-const KEYWORDS_DIR = `${{ROOT}}/keywords`;
+const ACTOR_DIR = `${ROOT}/actor`;
+const YEARS_DIR = `${ROOT}/years`;
+const RANKS_DIR = `${ROOT}/ranks`;
+const SERIES_DIR = `${ROOT}/series`;
+const KEYWORDS_DIR = `${ROOT}/keywords`;
 
-// === 通用：把"文件名/相对路径/维基链接/Link对象"解析为 Obsidian 文件对象 ===
-function resolveFile(anyPathLike, base){{
+"""
+
+# 演员页面dataviewjs中与演员无关的固定部分
+_ACTOR_PAGE_JS = """// === 通用：把"文件名/相对路径/维基链接/Link对象"解析为 Obsidian 文件对象 ===
+function resolveFile(anyPathLike, base){
   if (!anyPathLike) return null;
-  if (typeof anyPathLike === "string"){{
+  if (typeof anyPathLike === "string"){
     const s = anyPathLike.trim();
     // [[...]] 维基链接
     const m = s.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|[^\\]]+)?\\]\\]$/);
     if (m) return app.metadataCache.getFirstLinkpathDest(m[1], base);
     // 普通相对路径
     return app.vault.getAbstractFileByPath(s);
-  }}
+  }
   // Dataview 的链接对象
-  if (anyPathLike?.path){{
+  if (anyPathLike?.path){
     return app.vault.getAbstractFileByPath(anyPathLike.path)
         ?? app.metadataCache.getFirstLinkpathDest(anyPathLike.path, base);
-  }}
+  }
   return null;
-}}
+}
 
 // === 创建内部链接元素 ===
-function makeILink(targetPathOrName, label, sourcePath){{
+function makeILink(targetPathOrName, label, sourcePath){
   const t = String(targetPathOrName ?? "").trim();
   const src = sourcePath ?? dv.current().file.path;
   const dest = app.metadataCache.getFirstLinkpathDest(t, src);
@@ -288,10 +472,10 @@ function makeILink(targetPathOrName, label, sourcePath){{
   a.setAttribute('data-href', href);
   a.textContent = label ?? (dest ? dest.basename : t);
   return a;
-}}
+}
 
 // === 封面查找：从source目录的番号文件夹中查找封面 ===
-function findCoverForPage(p){{
+function findCoverForPage(p){
   let v = p.Cover;
   if (!v) return null;
 
@@ -301,90 +485,90 @@ function findCoverForPage(p){{
 
   // 兜底：在source目录的番号文件夹中查找封面
   const code = p.Code;
-  if (code) {{
+  if (code) {
     // 生成可能的目录名称变体
-    const getDirectoryVariants = (baseCode) => {{
+    const getDirectoryVariants = (baseCode) => {
       const variants = [baseCode];
 
       // 如果以数字结尾，尝试添加-C后缀
-      if (/\\d+$/.test(baseCode)) {{
+      if (/\\d+$/.test(baseCode)) {
         variants.push(baseCode + '-C');
-      }}
+      }
 
       // 如果已经以-C结尾，也尝试不带-C的版本
-      if (baseCode.endsWith('-C')) {{
+      if (baseCode.endsWith('-C')) {
         variants.push(baseCode.slice(0, -2));
-      }}
+      }
 
       return variants;
-    }};
+    };
 
     const directoryVariants = getDirectoryVariants(code);
 
     // 尝试所有可能的目录名称变体
-    for (const dirVariant of directoryVariants) {{
+    for (const dirVariant of directoryVariants) {
       const coverPaths = [
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-thumb.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/cover.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/thumb.jpg`
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-thumb.jpg`,
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/cover.jpg`,
+        `${COVER_DIR}/${dirVariant}/thumb.jpg`
       ];
 
-      for (const coverPath of coverPaths) {{
+      for (const coverPath of coverPaths) {
         const candidate = resolveFile(coverPath, p.file.path);
         if (candidate) return candidate;
-      }}
-    }}
-  }}
+      }
+    }
+  }
 
   return null;
-}}
+}
 
 // === 关键词页面所在文件夹 ===
 const KW_DIR = KEYWORDS_DIR;
 
-function kwLinksCell(p){{
+function kwLinksCell(p){
   const raw = p.Keywords;
   let arr = [];
 
   // 统一成数组
-  if (Array.isArray(raw)) {{
+  if (Array.isArray(raw)) {
     arr = raw;
-  }} else if (typeof raw === 'string') {{
+  } else if (typeof raw === 'string') {
     arr = raw.split(/[,，;；、\\s]+/);
-  }} else {{
+  } else {
     arr = [];
-  }}
+  }
 
   // 创建容器元素
   const container = document.createElement('div');
   container.className = 'kw-badges';
 
   // 逐个创建徽章元素
-  arr.forEach(k => {{
+  arr.forEach(k => {
     if (!k) return;
 
     let target, label;
-    if (typeof k === 'object' && k.path) {{
+    if (typeof k === 'object' && k.path) {
       target = k.path;
       label = k.display ?? k.path.split('/').pop();
-    }} else {{
+    } else {
       let t = String(k).trim();
       if (!t) return;
-      if (/^\\[\\[.*\\]\\]$/.test(t)) {{
+      if (/^\\[\\[.*\\]\\]$/.test(t)) {
         // 已经是 [[...]] 格式
         const m = t.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|([^\\]]+))?\\]\\]$/);
-        if (m) {{
+        if (m) {
           target = m[1];
           label = m[2] ?? m[1].split('/').pop();
-        }}
-      }} else {{
+        }
+      } else {
         // 普通字符串，添加目录前缀
-        target = KW_DIR ? `${{KW_DIR}}/${{t}}` : t;
+        target = KW_DIR ? `${KW_DIR}/${t}` : t;
         label = t;
-      }}
-    }}
+      }
+    }
 
     // 创建徽章元素
     const badge = document.createElement('span');
@@ -395,21 +579,21 @@ function kwLinksCell(p){{
     badge.appendChild(link);
 
     container.appendChild(badge);
-  }});
+  });
 
   return container;
-}}
+}
 
 // === 获取当前演员的所有作品 ===
-const actorPages = dv.pages(`"${{META_DIR}}"`).where(p => p.Actor === ACTOR_NAME).sort(p => p.Code ?? "", "asc");
+const actorPages = dv.pages(`"${META_DIR}"`).where(p => p.Actor === ACTOR_NAME).sort(p => p.Code ?? "", "asc");
 
 // === 输出表格 ===
 dv.table(
   ["Cover", "CN", "JP", "Code", "Year", "Time", "Rank", "Keywords"],
-  actorPages.map(p => {{
+  actorPages.map(p => {
     const coverFile = findCoverForPage(p);
     const coverHtml = coverFile
-      ? `<img class="myTableImg" src="${{app.vault.adapter.getResourcePath(coverFile.path)}}" loading="lazy">`
+      ? `<img class="myTableImg" src="${app.vault.adapter.getResourcePath(coverFile.path)}" loading="lazy">`
       : `<div class="myTableImg no-cover-placeholder" style="
           width: 100px;
           height: 210px;
@@ -441,184 +625,112 @@ dv.table(
       "🇨🇳" + " " + (p.CN ?? ""),
       "🇯🇵" + " " + (p.JP ?? ""),
       "🪪 " + "[[" + (p.Code ?? "") + "]]",
-      "📅 " + "[[" + (p.Year ? `${{YEARS_DIR}}/${{p.Year}}` : "") + "|" + (p.Year ?? "") + "]]",
+      "📅 " + "[[" + (p.Year ? `${YEARS_DIR}/${p.Year}` : "") + "|" + (p.Year ?? "") + "]]",
       "🕒 " + (p.Time ?? ""),
-      "🌡️ " + "[[" + (p.VideoRank ? `${{RANKS_DIR}}/${{p.VideoRank}}` : "") + "|" + (p.VideoRank ?? "") + "]]",
+      "🌡️ " + "[[" + (p.VideoRank ? `${RANKS_DIR}/${p.VideoRank}` : "") + "|" + (p.VideoRank ?? "") + "]]",
       kwLinksCell(p),
     ];
-  }})
+  })
 );
 
 // === 统计信息 ===
 const totalCount = actorPages.length;
 
 // 计算年份分布
-const yearCounts = {{}};
-actorPages.forEach(p => {{
+const yearCounts = {};
+actorPages.forEach(p => {
   const year = p.Year;
-  if (year) {{
+  if (year) {
     yearCounts[year] = (yearCounts[year] || 0) + 1;
-  }}
-}});
+  }
+});
 
 const yearStats = Object.entries(yearCounts)
   .sort(([,a], [,b]) => a - b)
-  .map(([year, count]) => `${{year}}年 (${{count}}部)`)
+  .map(([year, count]) => `${year}年 (${count}部)`)
   .join(", ");
 
-dv.paragraph(`**📊 作品总数**: ${{totalCount}} 部`);
-dv.paragraph(`**📅 年份分布**: ${{yearStats}}`);
+dv.paragraph(`**📊 作品总数**: ${totalCount} 部`);
+dv.paragraph(`**📅 年份分布**: ${yearStats}`);
 ```
 """
-        return content
 
 
-class CategoryPageGenerator:
-    """分类页面生成器 - 支持Keywords、Ranks、Series、Years"""
+class ActorPageGenerator:
+    """演员页面生成器"""
 
     def __init__(self, config: Config):
         self.config = config
-        self.base_dir = Path(config.get('paths.output_directory', 'obsidian_output')).parent
-
-    def generate_all_category_pages(self, media_groups: Dict[str, MediaInfo]):
-        """生成所有分类页面"""
-        categories = ['keywords', 'ranks', 'series', 'years']
-
-        for category in categories:
-            logging.info(f"开始生成{category}页面...")
-            self._generate_category_pages(category, media_groups)
-
-        logging.info("所有分类页面生成完成")
-
-    def _generate_category_pages(self, category_type: str, media_groups: Dict[str, MediaInfo]):
-        """生成特定类型的分类页面"""
-        category_dir = self.base_dir / category_type
-        category_dir.mkdir(exist_ok=True)
+        self.actor_dir = Path(config.get('paths.output_directory', 'obsidian_output')).parent / 'actor'
+        self.actor_dir.mkdir(exist_ok=True)
+        self.nfo_parser = NFOParser(config)
 
-        # 收集分类和对应的作品
-        category_works = {}
+    def generate_actor_pages(self, media_groups: Dict[str, MediaInfo]):
+        """为所有演员生成页面"""
+        # 收集所有演员和他们的作品
+        actor_works = defaultdict(list)
 
         for code, media_info in media_groups.items():
-            # 解析NFO文件获取分类信息
-            categories = self._get_category_from_media(media_info, category_type)
-            for category in categories:
-                if category not in ["", "未知", None]:
-                    if category not in category_works:
-                        category_works[category] = []
-                    category_works[category].append(media_info)
-
-        # 为每个分类生成页面
-        for category, works in category_works.items():
-            self._generate_category_page(category_type, category, works)
-
-        logging.info(f"已生成 {len(category_works)} 个{category_type}页面")
-
-    def _get_category_from_media(self, media_info: MediaInfo, category_type: str) -> List[str]:
-        """从媒体信息中获取分类列表"""
-        categories = []
+            # 解析NFO文件获取演员信息
+            actors = self._get_actors_from_media(media_info)
+            for actor in actors:
+                if actor not in _BLOCKED_ACTORS:
+                    actor_works[actor].append(media_info)
 
-        # 如果有NFO文件，解析获取分类信息
-        if media_info.nfo_path and os.path.exists(media_info.nfo_path):
-            try:
-                nfo_parser = NFOParser(self.config)
-                nfo_data = nfo_parser.parse_nfo(media_info.nfo_path)
+        # 为每个演员生成页面（各页面互不依赖，并行写入）
+        max_workers = self.config.get('advanced.max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._generate_actor_page, actor_works.keys(), actor_works.values()))
 
-                if category_type == 'keywords':
-                    # 从genre字段获取关键词
-                    genres = nfo_data.get('genre', [])
-                    if genres:
-                        categories.extend(genres)
-                elif category_type == 'ranks':
-                    # 从rating字段获取评分，统一格式化为一位小数
-                    rating = nfo_data.get('rating', 0)
-                    if rating > 0:
-                        categories.append(str(round(rating, 1)))
-                elif category_type == 'series':
-                    # 从series字段获取系列
-                    series = nfo_data.get('series', '')
-                    if series and series.strip():
-                        categories.append(series.strip())
-                elif category_type == 'years':
-                    # 从release_date字段获取年份
-                    release_date = nfo_data.get('release_date', '')
-                    if release_date:
-                        year = self._extract_year_from_date(release_date)
-                        if year and year != "未知":
-                            categories.append(year)
+        logging.info(f"已生成 {len(actor_works)} 个演员页面")
 
-            except Exception as e:
-                logging.warning(f"解析NFO文件获取{category_type}信息失败: {e}")
+    def _get_actors_from_media(self, media_info: MediaInfo) -> List[str]:
+        """从媒体信息中获取演员列表"""
+        actors = []
 
-        # 备用：从media_info直接获取
-        if not categories:
-            if category_type == 'keywords' and media_info.genre:
-                categories.extend(media_info.genre)
-            elif category_type == 'years' and media_info.release_date:
-                year = self._extract_year_from_date(media_info.release_date)
-                if year and year != "未知":
-                    categories.append(year)
+        # 如果有NFO文件，解析获取演员
+        try:
+            nfo_data = load_nfo_data(media_info, self.nfo_parser)
+            nfo_actors = nfo_data.get('actors', [])
+            if nfo_actors:
+                actors.extend(nfo_actors)
+        except Exception as e:
+            logging.warning(f"解析NFO文件获取演员信息失败: {e}")
 
-        return categories
+        # 如果NFO解析失败，使用media_info中的演员
+        if not actors and media_info.actors:
+            actors = media_info.actors
 
-    def _extract_year_from_date(self, date_str: str) -> str:
-        """从日期字符串中提取年份"""
-        import re
-        year_match = re.search(r'(\d{4})', date_str)
-        return year_match.group(1) if year_match else "未知"
+        return actors
 
-    def _generate_category_page(self, category_type: str, category: str, works: List[MediaInfo]):
-        """生成单个分类页面"""
-        category_file = self.base_dir / category_type / f"{category}.md"
+    def _generate_actor_page(self, actor: str, works: List[MediaInfo]):
+        """生成单个演员页面"""
+        actor_file = self.actor_dir / f"{actor}.md"
 
         # 生成页面内容
-        content = self._generate_category_content(category_type, category, works)
+        content = self._generate_actor_content(actor, works)
 
         # 写入文件
-        with open(category_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_text_file(actor_file, content)
 
-        logging.info(f"已生成{category_type}页面: {category_file}")
+        logging.info("已生成演员页面: %s", actor_file)
 
-    def _generate_category_content(self, category_type: str, category: str, works: List[MediaInfo]) -> str:
-        """生成分类页面内容 - 基于preview.md的样式"""
+    def _generate_actor_content(self, actor: str, works: List[MediaInfo]) -> str:
+        """生成演员页面内容 - 基于preview.md的样式"""
 
         # 获取配置路径
         root_dir = self.config.get('dataview.root_dir', 'jav_store/source')
+        actor_dir = f'{root_dir}/actor'
+        years_dir = f'{root_dir}/years'
+        ranks_dir = f'{root_dir}/ranks'
+        keywords_dir = f'{root_dir}/keywords'
 
-        # 根据分类类型设置配置
-        type_configs = {
-            'keywords': {
-                'title': f"🏷️ {category}",
-                'icon': '🏷️',
-                'filter_field': 'Keywords',
-                'dir': f'{root_dir}/keywords'
-            },
-            'ranks': {
-                'title': f"⭐ {category}分",
-                'icon': '⭐',
-                'filter_field': 'VideoRank',
-                'dir': f'{root_dir}/ranks'
-            },
-            'series': {
-                'title': f"📺 {category}",
-                'icon': '📺',
-                'filter_field': 'Series',
-                'dir': f'{root_dir}/series'
-            },
-            'years': {
-                'title': f"📅 {category}年",
-                'icon': '📅',
-                'filter_field': 'Year',
-                'dir': f'{root_dir}/years'
-            }
-        }
-
-        config = type_configs.get(category_type, type_configs['keywords'])
+        content = _ACTOR_PAGE_HEADER.replace('__ACTOR_NAME__', actor)
+        return content + _ACTOR_PAGE_JS
 
-        # 按番号排序作品
-        works_sorted = sorted(works, key=lambda x: x.code)
 
-        content = f"""---
+# 分类页面头部，__TITLE__ / __CATEGORY_TYPE__ / __CATEGORY_VALUE__ 为占位符
+_CATEGORY_PAGE_HEADER = """---
 cssclasses:
   - cards-cols-6
   - cards-cover
@@ -626,45 +738,48 @@ cssclasses:
   - cards
 ---
 
-# {config['title']}
+# __TITLE__
 
 ```dataviewjs
 
 // === 分类专属页面配置 ===
-const CATEGORY_TYPE = "{category_type}";
-const CATEGORY_VALUE = "{category}";
+const CATEGORY_TYPE = "__CATEGORY_TYPE__";
+const CATEGORY_VALUE = "__CATEGORY_VALUE__";
 const ROOT = "jav_store";
-const META_DIR = `${{ROOT}}/films`;
-const COVER_DIR = `${{ROOT}}/source`;
+const META_DIR = `${ROOT}/films`;
+const COVER_DIR = `${ROOT}/source`;
 
 // 分类目录常量
-const ACTOR_DIR = `${{ROOT}}/actor`;
-const YEARS_DIR = `${{ROOT}}/years`;
-const RANKS_DIR = `${{ROOT}}/ranks`;
-const SERIES_DIR = `${{ROOT}}/series`;
-const KEYWORDS_DIR = `${{ROOT}}/keywords`;
+const ACTOR_DIR = `${ROOT}/actor`;
+const YEARS_DIR = `${ROOT}/years`;
+const RANKS_DIR = `${ROOT}/ranks`;
+const SERIES_DIR = `${ROOT}/series`;
+const KEYWORDS_DIR = `${ROOT}/keywords`;
 
-// === 通用：把"文件名/相对路径/维基链接/Link对象"解析为 Obsidian 文件对象 ===
-function resolveFile(anyPathLike, base){{
+"""
+
+# 分类页面dataviewjs中与具体分类无关的固定部分
+_CATEGORY_PAGE_JS = """// === 通用：把"文件名/相对路径/维基链接/Link对象"解析为 Obsidian 文件对象 ===
+function resolveFile(anyPathLike, base){
   if (!anyPathLike) return null;
-  if (typeof anyPathLike === "string"){{
+  if (typeof anyPathLike === "string"){
     const s = anyPathLike.trim();
     // [[...]] 维基链接
     const m = s.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|[^\\]]+)?\\]\\]$/);
     if (m) return app.metadataCache.getFirstLinkpathDest(m[1], base);
     // 普通相对路径
     return app.vault.getAbstractFileByPath(s);
-  }}
+  }
   // Dataview 的链接对象
-  if (anyPathLike?.path){{
+  if (anyPathLike?.path){
     return app.vault.getAbstractFileByPath(anyPathLike.path)
         ?? app.metadataCache.getFirstLinkpathDest(anyPathLike.path, base);
-  }}
+  }
   return null;
-}}
+}
 
 // === 创建内部链接元素 ===
-function makeILink(targetPathOrName, label, sourcePath){{
+function makeILink(targetPathOrName, label, sourcePath){
   const t = String(targetPathOrName ?? "").trim();
   const src = sourcePath ?? dv.current().file.path;
   const dest = app.metadataCache.getFirstLinkpathDest(t, src);
@@ -675,10 +790,10 @@ function makeILink(targetPathOrName, label, sourcePath){{
   a.setAttribute('data-href', href);
   a.textContent = label ?? (dest ? dest.basename : t);
   return a;
-}}
+}
 
 // === 封面查找：从source目录的番号文件夹中查找封面 ===
-function findCoverForPage(p){{
+function findCoverForPage(p){
   let v = p.Cover;
   if (!v) return null;
 
@@ -688,90 +803,90 @@ function findCoverForPage(p){{
 
   // 兜底：在source目录的番号文件夹中查找封面
   const code = p.Code;
-  if (code) {{
+  if (code) {
     // 生成可能的目录名称变体
-    const getDirectoryVariants = (baseCode) => {{
+    const getDirectoryVariants = (baseCode) => {
       const variants = [baseCode];
 
       // 如果以数字结尾，尝试添加-C后缀
-      if (/\\d+$/.test(baseCode)) {{
+      if (/\\d+$/.test(baseCode)) {
         variants.push(baseCode + '-C');
-      }}
+      }
 
       // 如果已经以-C结尾，也尝试不带-C的版本
-      if (baseCode.endsWith('-C')) {{
+      if (baseCode.endsWith('-C')) {
         variants.push(baseCode.slice(0, -2));
-      }}
+      }
 
       return variants;
-    }};
+    };
 
     const directoryVariants = getDirectoryVariants(code);
 
     // 尝试所有可能的目录名称变体
-    for (const dirVariant of directoryVariants) {{
+    for (const dirVariant of directoryVariants) {
       const coverPaths = [
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-thumb.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/cover.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/thumb.jpg`
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-thumb.jpg`,
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/cover.jpg`,
+        `${COVER_DIR}/${dirVariant}/thumb.jpg`
       ];
 
-      for (const coverPath of coverPaths) {{
+      for (const coverPath of coverPaths) {
         const candidate = resolveFile(coverPath, p.file.path);
         if (candidate) return candidate;
-      }}
-    }}
-  }}
+      }
+    }
+  }
 
   return null;
-}}
+}
 
 // === 关键词页面所在文件夹 ===
 const KW_DIR = KEYWORDS_DIR;
 
-function kwLinksCell(p){{
+function kwLinksCell(p){
   const raw = p.Keywords;
   let arr = [];
 
   // 统一成数组
-  if (Array.isArray(raw)) {{
+  if (Array.isArray(raw)) {
     arr = raw;
-  }} else if (typeof raw === 'string') {{
+  } else if (typeof raw === 'string') {
     arr = raw.split(/[,，;；、\\s]+/);
-  }} else {{
+  } else {
     arr = [];
-  }}
+  }
 
   // 创建容器元素
   const container = document.createElement('div');
   container.className = 'kw-badges';
 
   // 逐个创建徽章元素
-  arr.forEach(k => {{
+  arr.forEach(k => {
     if (!k) return;
 
     let target, label;
-    if (typeof k === 'object' && k.path) {{
+    if (typeof k === 'object' && k.path) {
       target = k.path;
       label = k.display ?? k.path.split('/').pop();
-    }} else {{
+    } else {
       let t = String(k).trim();
       if (!t) return;
-      if (/^\\[\\[.*\\]\\]$/.test(t)) {{
+      if (/^\\[\\[.*\\]\\]$/.test(t)) {
         // 已经是 [[...]] 格式
         const m = t.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|([^\\]]+))?\\]\\]$/);
-        if (m) {{
+        if (m) {
           target = m[1];
           label = m[2] ?? m[1].split('/').pop();
-        }}
-      }} else {{
+        }
+      } else {
         // 普通字符串，添加目录前缀
-        target = KW_DIR ? `${{KW_DIR}}/${{t}}` : t;
+        target = KW_DIR ? `${KW_DIR}/${t}` : t;
         label = t;
-      }}
-    }}
+      }
+    }
 
     // 创建徽章元素
     const badge = document.createElement('span');
@@ -782,66 +897,66 @@ function kwLinksCell(p){{
     badge.appendChild(link);
 
     container.appendChild(badge);
-  }});
+  });
 
   return container;
-}}
+}
 
 // === 根据分类类型获取过滤函数 ===
-function filterByCategory(pages) {{
-  if (CATEGORY_TYPE === 'keywords') {{
+function filterByCategory(pages) {
+  if (CATEGORY_TYPE === 'keywords') {
     // 关键词过滤：检查Keywords字段中是否包含当前关键词
-    return pages.where(p => {{
+    return pages.where(p => {
       const keywords = p.Keywords || [];
       // 处理嵌套数组格式: [[- - keyword1], [- - keyword2]]
-      const flattenKeywords = (arr) => {{
+      const flattenKeywords = (arr) => {
         let result = [];
-        for (const item of arr) {{
-          if (Array.isArray(item)) {{
+        for (const item of arr) {
+          if (Array.isArray(item)) {
             result = result.concat(flattenKeywords(item));
-          }} else if (typeof item === 'string') {{
+          } else if (typeof item === 'string') {
             result.push(item);
-          }}
-        }}
+          }
+        }
         return result;
-      }};
+      };
       const keywordArray = flattenKeywords(keywords);
-      return keywordArray.some(kw => {{
-        if (typeof kw === 'object' && kw.path) {{
+      return keywordArray.some(kw => {
+        if (typeof kw === 'object' && kw.path) {
           return kw.path.split('/').pop() === CATEGORY_VALUE;
-        }} else if (typeof kw === 'string') {{
+        } else if (typeof kw === 'string') {
           const cleanKw = kw.replace(/^\\[\\[|\\]\\]$/g, '').split('|').pop().trim();
           return cleanKw === CATEGORY_VALUE;
-        }}
+        }
         return false;
-      }});
-    }});
-  }} else {{
+      });
+    });
+  } else {
     // 其他分类：直接比较字段值
-    if (CATEGORY_TYPE === 'ranks') {{
+    if (CATEGORY_TYPE === 'ranks') {
       return pages.where(p => p.VideoRank == CATEGORY_VALUE);
-    }} else if (CATEGORY_TYPE === 'series') {{
+    } else if (CATEGORY_TYPE === 'series') {
       return pages.where(p => p.Series === CATEGORY_VALUE);
-    }} else if (CATEGORY_TYPE === 'years') {{
+    } else if (CATEGORY_TYPE === 'years') {
       return pages.where(p => p.Year === CATEGORY_VALUE);
-    }} else {{
+    } else {
       return pages.where(p => p[CATEGORY_TYPE.charAt(0).toUpperCase() + CATEGORY_TYPE.slice(1, -1)] === CATEGORY_VALUE);
-    }}
-  }}
-}}
+    }
+  }
+}
 
 // === 获取当前分类的所有作品 ===
-const allPages = dv.pages(`"${{META_DIR}}"`);
+const allPages = dv.pages(`"${META_DIR}"`);
 const categoryPages = filterByCategory(allPages).sort(p => p.Code ?? "", "asc");
 
 
 // === 输出表格 ===
 dv.table(
   ["Cover", "CN", "JP", "Code", "Actor", "Time", "Rank", "Keywords"],
-  categoryPages.map(p => {{
+  categoryPages.map(p => {
     const coverFile = findCoverForPage(p);
     const coverHtml = coverFile
-      ? `<img class="myTableImg" src="${{app.vault.adapter.getResourcePath(coverFile.path)}}" loading="lazy">`
+      ? `<img class="myTableImg" src="${app.vault.adapter.getResourcePath(coverFile.path)}" loading="lazy">`
       : `<div class="myTableImg no-cover-placeholder" style="
           width: 100px;
           height: 210px;
@@ -873,43 +988,198 @@ dv.table(
       "🇨🇳" + " " + (p.CN ?? ""),
       "🇯🇵" + " " + (p.JP ?? ""),
       "🪪 " + "[[" + (p.Code ?? "") + "]]",
-      "👰 " + "[[" + (p.Actor ? `${{ACTOR_DIR}}/${{p.Actor}}` : "") + "|" + (p.Actor ?? "") + "]]",
+      "👰 " + "[[" + (p.Actor ? `${ACTOR_DIR}/${p.Actor}` : "") + "|" + (p.Actor ?? "") + "]]",
       "🕒 " + (p.Time ?? ""),
-      "🌡️ " + "[[" + (p.VideoRank ? `${{RANKS_DIR}}/${{p.VideoRank}}` : "") + "|" + (p.VideoRank ?? "") + "]]",
+      "🌡️ " + "[[" + (p.VideoRank ? `${RANKS_DIR}/${p.VideoRank}` : "") + "|" + (p.VideoRank ?? "") + "]]",
       kwLinksCell(p),
     ];
-  }})
+  })
 );
 
 // === 统计信息 ===
 const totalCount = categoryPages.length;
 
 // 根据分类类型计算不同的统计信息
-let statsText = `**📊 作品总数**: ${{totalCount}} 部`;
+let statsText = `**📊 作品总数**: ${totalCount} 部`;
 
-if (CATEGORY_TYPE === 'years') {{
+if (CATEGORY_TYPE === 'years') {
   // 年份分类：计算月份分布
-  const monthCounts = {{}};
-  categoryPages.forEach(p => {{
+  const monthCounts = {};
+  categoryPages.forEach(p => {
     const date = p.file.path.split('/').pop().replace('.md', '');
     // 这里可以添加更复杂的月份统计逻辑
-  }});
-  statsText += `\\n**📅 年度作品**: ${{totalCount}} 部`;
-}} else if (CATEGORY_TYPE === 'ranks') {{
+  });
+  statsText += `\\n**📅 年度作品**: ${totalCount} 部`;
+} else if (CATEGORY_TYPE === 'ranks') {
   // 评分分类：计算平均评分等
-  statsText += `\\n**⭐ 评分级别**: ${{CATEGORY_VALUE}}分`;
-}} else if (CATEGORY_TYPE === 'series') {{
+  statsText += `\\n**⭐ 评分级别**: ${CATEGORY_VALUE}分`;
+} else if (CATEGORY_TYPE === 'series') {
   // 系列分类：显示系列信息
-  statsText += `\\n**📺 系列作品**: ${{CATEGORY_VALUE}}`;
-}} else if (CATEGORY_TYPE === 'keywords') {{
+  statsText += `\\n**📺 系列作品**: ${CATEGORY_VALUE}`;
+} else if (CATEGORY_TYPE === 'keywords') {
   // 关键词分类：显示其他相关关键词
-  statsText += `\\n**🏷️ 关键词**: ${{CATEGORY_VALUE}}`;
-}}
+  statsText += `\\n**🏷️ 关键词**: ${CATEGORY_VALUE}`;
+}
 
 dv.paragraph(statsText);
 ```
 """
-        return content
+
+
+class CategoryPageGenerator:
+    """分类页面生成器 - 支持Keywords、Ranks、Series、Years"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.base_dir = Path(config.get('paths.output_directory', 'obsidian_output')).parent
+        self.nfo_parser = NFOParser(config)
+
+        # 预先计算并创建各分类目录
+        self._category_dirs = {ct: self.base_dir / ct for ct in ('keywords', 'ranks', 'series', 'years')}
+        for category_dir in self._category_dirs.values():
+            category_dir.mkdir(exist_ok=True)
+
+    def generate_all_category_pages(self, media_groups: Dict[str, MediaInfo]):
+        """生成所有分类页面"""
+        for category in self._category_dirs:
+            logging.info(f"开始生成{category}页面...")
+            self._generate_category_pages(category, media_groups)
+
+        logging.info("所有分类页面生成完成")
+
+    def _generate_category_pages(self, category_type: str, media_groups: Dict[str, MediaInfo]):
+        """生成特定类型的分类页面"""
+        # 收集分类和对应的作品
+        category_works = defaultdict(list)
+
+        for code, media_info in media_groups.items():
+            # 解析NFO文件获取分类信息
+            categories = self._get_category_from_media(media_info, category_type)
+            for category in categories:
+                if category not in _BLOCKED_CATEGORIES:
+                    category_works[category].append(media_info)
+
+        # 为每个分类生成页面（各页面互不依赖，并行写入）
+        max_workers = self.config.get('advanced.max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda item: self._generate_category_page(category_type, *item),
+                              category_works.items()))
+
+        logging.info(f"已生成 {len(category_works)} 个{category_type}页面")
+
+    def _get_category_from_media(self, media_info: MediaInfo, category_type: str) -> List[str]:
+        """从媒体信息中获取分类列表"""
+        categories = []
+
+        # 如果有NFO文件，解析获取分类信息
+        if media_info.nfo_path:
+            try:
+                nfo_data = load_nfo_data(media_info, self.nfo_parser)
+
+                if category_type == 'keywords':
+                    # 从genre字段获取关键词
+                    genres = nfo_data.get('genre', [])
+                    if genres:
+                        categories.extend(genres)
+                elif category_type == 'ranks':
+                    # 从rating字段获取评分，统一格式化为一位小数
+                    rating = nfo_data.get('rating', 0)
+                    if rating > 0:
+                        categories.append(str(round(rating, 1)))
+                elif category_type == 'series':
+                    # 从series字段获取系列
+                    series = nfo_data.get('series', '')
+                    if series and series.strip():
+                        categories.append(series.strip())
+                elif category_type == 'years':
+                    # 从release_date字段获取年份
+                    release_date = nfo_data.get('release_date', '')
+                    if release_date:
+                        year = self._extract_year_from_date(release_date)
+                        if year and year != "未知":
+                            categories.append(year)
+
+            except Exception as e:
+                logging.warning(f"解析NFO文件获取{category_type}信息失败: {e}")
+
+        # 备用：从media_info直接获取
+        if not categories:
+            if category_type == 'keywords' and media_info.genre:
+                categories.extend(media_info.genre)
+            elif category_type == 'years' and media_info.release_date:
+                year = self._extract_year_from_date(media_info.release_date)
+                if year and year != "未知":
+                    categories.append(year)
+
+        return categories
+
+    def _extract_year_from_date(self, date_str: str) -> str:
+        """从日期字符串中提取年份"""
+        year_match = _YEAR_RE.search(date_str)
+        return year_match.group(1) if year_match else "未知"
+
+    def _generate_category_page(self, category_type: str, category: str, works: List[MediaInfo]):
+        """生成单个分类页面"""
+        category_file = self._category_dirs[category_type] / f"{category}.md"
+
+        # 生成页面内容
+        content = self._generate_category_content(category_type, category, works)
+
+        # 写入文件
+        _write_text_file(category_file, content)
+
+        logging.info("已生成%s页面: %s", category_type, category_file)
+
+    def _generate_category_content(self, category_type: str, category: str, works: List[MediaInfo]) -> str:
+        """生成分类页面内容 - 基于preview.md的样式"""
+
+        # 获取配置路径
+        root_dir = self.config.get('dataview.root_dir', 'jav_store/source')
+
+        # 根据分类类型设置配置
+        type_configs = {
+            'keywords': {
+                'title': f"🏷️ {category}",
+                'icon': '🏷️',
+                'filter_field': 'Keywords',
+                'dir': f'{root_dir}/keywords'
+            },
+            'ranks': {
+                'title': f"⭐ {category}分",
+                'icon': '⭐',
+                'filter_field': 'VideoRank',
+                'dir': f'{root_dir}/ranks'
+            },
+            'series': {
+                'title': f"📺 {category}",
+                'icon': '📺',
+                'filter_field': 'Series',
+                'dir': f'{root_dir}/series'
+            },
+            'years': {
+                'title': f"📅 {category}年",
+                'icon': '📅',
+                'filter_field': 'Year',
+                'dir': f'{root_dir}/years'
+            }
+        }
+
+        config = type_configs.get(category_type, type_configs['keywords'])
+
+        content = (_CATEGORY_PAGE_HEADER
+                   .replace('__CATEGORY_TYPE__', category_type)
+                   .replace('__CATEGORY_VALUE__', category)
+                   .replace('__TITLE__', config['title']))
+        return content + _CATEGORY_PAGE_JS
+
+
+# 视频文件类型后缀 -> MediaInfo字段
+_VIDEO_SLOTS = {
+    None: 'video_path',
+    'MAIN': 'video_path',
+    'VIDEO': 'video_path',
+    'TRAILER': 'trailer_path',
+}
 
 
 class MediaScanner:
@@ -925,20 +1195,44 @@ class MediaScanner:
         self.output_dir = Path(config.get('paths.output_directory', 'obsidian_output'))
         self.output_dir.mkdir(exist_ok=True)
 
-        # 从配置获取文件扩展名
-        self.video_extensions = set(config.get('file_patterns.video_extensions',
-                                             ['.mp4', '.mkv', '.avi', '.mov', '.wmv']))
-        self.strm_extensions = set(config.get('file_patterns.strm_extensions', ['.strm']))
-        self.image_extensions = set(config.get('file_patterns.image_extensions',
-                                              ['.jpg', '.jpeg', '.png', '.webp']))
-
-        # 获取文件关键词
-        self.poster_keywords = config.get('file_patterns.poster_keywords',
-                                          ['poster', 'cover', 'thumb'])
-        self.fanart_keywords = config.get('file_patterns.fanart_keywords',
-                                          ['fanart', 'backdrop', 'background'])
-        self.trailer_keywords = config.get('file_patterns.trailer_keywords',
-                                           ['trailer', 'preview', 'sample'])
+        # 从配置获取文件扩展名（统一小写，与小写后缀直接比较）
+        self.video_extensions = frozenset(e.lower() for e in config.get('file_patterns.video_extensions',
+                                                                      ['.mp4', '.mkv', '.avi', '.mov', '.wmv']))
+        self.strm_extensions = frozenset(e.lower() for e in config.get('file_patterns.strm_extensions', ['.strm']))
+        self.image_extensions = frozenset(e.lower() for e in config.get('file_patterns.image_extensions',
+                                                                      ['.jpg', '.jpeg', '.png', '.webp']))
+
+        # 获取文件关键词（统一小写，与小写文件名比较）
+        self.poster_keywords = frozenset(k.lower() for k in config.get('file_patterns.poster_keywords',
+                                                                     ['poster', 'cover', 'thumb']))
+        self.fanart_keywords = frozenset(k.lower() for k in config.get('file_patterns.fanart_keywords',
+                                                                     ['fanart', 'backdrop', 'background']))
+        self.trailer_keywords = frozenset(k.lower() for k in config.get('file_patterns.trailer_keywords',
+                                                                      ['trailer', 'preview', 'sample']))
+        # 海报/背景图关键词编译为单个正则，一次扫描完成所有关键词的子串匹配
+        self._poster_re = self._compile_keywords(self.poster_keywords)
+        self._fanart_re = self._compile_keywords(self.fanart_keywords)
+
+        # 从配置获取番号格式并预编译 - 只提取基础番号
+        code_patterns = config.get('file_patterns.code_patterns', [
+            r'([A-Z]+-\d+)(?:-[A-Z])?',  # 标准格式: EDRG-009, EDRG-009-F
+            r'([A-Z]{2,}\d{3,})',        # 无分隔符: ABC123
+            r'(FC2-\d{7})',              # FC2格式
+        ])
+        # 用户配置的正则可能含内联标志、命名组或反向引用，不能合并成一个正则，按顺序逐个匹配
+        self._code_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in code_patterns]
+
+        # 小写后缀 -> 文件类别，按分类优先级（视频 > NFO > 图片）后写覆盖先写
+        self._ext_classes = dict.fromkeys(self.image_extensions, 'image')
+        self._ext_classes['.nfo'] = 'nfo'
+        self._ext_classes.update(dict.fromkeys(self.video_extensions | self.strm_extensions, 'video'))
+
+    @staticmethod
+    def _compile_keywords(keywords) -> Optional[re.Pattern]:
+        """把关键词集合编译为子串匹配的正则，关键词为空时返回None"""
+        if not keywords:
+            return None
+        return re.compile('|'.join(map(re.escape, keywords)))
 
     def scan_directory(self) -> Dict[str, MediaInfo]:
         """扫描目录，按番号分组文件"""
@@ -946,22 +1240,15 @@ class MediaScanner:
         recursive = self.config.get('basic.recursive', True)
 
         # 获取所有文件
-        all_files = []
+        all_entries = []
         for source_dir in self.source_dirs:
             if source_dir.exists():
                 logging.info(f"扫描目录: {source_dir}")
-                for root, dirs, files in os.walk(source_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        all_files.append(file_path)
-
-                    # 如果不递归，清空子目录列表
-                    if not recursive:
-                        dirs.clear()
+                all_entries.extend(self._iter_entries(str(source_dir), recursive))
 
         # 按番号分组
-        for file_path in all_files:
-            code = self.extract_code_from_filename(file_path.name)
+        for entry in all_entries:
+            code = self.extract_code_from_filename(entry.name)
             if not code:
                 continue
 
@@ -969,45 +1256,63 @@ class MediaScanner:
                 media_groups[code] = MediaInfo(code=code)
 
             # 分类文件
-            self.categorize_file(file_path, media_groups[code])
+            self.categorize_file(entry.path, media_groups[code], entry.name, entry)
 
         return media_groups
 
+    def _iter_entries(self, root: str, recursive: bool):
+        """用os.scandir遍历目录，先产出当前目录的文件，再进入子目录（与os.walk顺序一致）"""
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError as e:
+            logging.warning(f"无法读取目录 {root}: {e}")
+            return
+
+        sub_dirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry
+            elif recursive and not entry.is_symlink():
+                sub_dirs.append(entry.path)
+
+        for sub_dir in sub_dirs:
+            yield from self._iter_entries(sub_dir, recursive)
+
+    @staticmethod
+    def _entry_size(entry: Optional[os.DirEntry]) -> Optional[int]:
+        """读取目录项的文件大小（Windows下直接来自目录列表，无需额外stat）"""
+        if entry is None:
+            return None
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return None
+
     def extract_code_from_filename(self, filename: str) -> Optional[str]:
         """从文件名中提取基础番号，忽略文件类型后缀"""
-        # 从配置获取番号格式 - 修改为只提取基础番号
-        patterns = self.config.get('file_patterns.code_patterns', [
-            r'([A-Z]+-\d+)(?:-[A-Z])?',  # 标准格式: EDRG-009, EDRG-009-F
-            r'([A-Z]{2,}\d{3,})',        # 无分隔符: ABC123
-            r'(FC2-\d{7})',              # FC2格式
-        ])
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
+        for pattern in self._code_patterns:
+            match = pattern.search(filename)
             if match:
-                # 只返回基础番号部分，忽略后缀
-                base_code = match.group(1).upper()
-                return base_code
+                # 只返回基础番号部分（第一个捕获组），忽略后缀
+                return (match.group(1) if pattern.groups else match.group(0)).upper()
 
         return None
 
-    def extract_file_type(self, filename: str) -> Optional[str]:
-        """从文件名中提取文件类型后缀"""
+    def extract_file_type(self, filename: str, filename_lower: Optional[str] = None) -> Optional[str]:
+        """从文件名中提取文件类型后缀，filename_lower为调用方已算好的小写文件名"""
         # 检查文件类型后缀
-        patterns = [
-            r'[A-Z]+-\d+-([A-Z])\.',     # EDRG-009-F -> F
-            r'[A-Z]+-\d+-([A-Z]+)\.',    # EDRG-009-TRAILER -> TRAILER
-            r'[A-Z]+-\d+-thumb\.',       # 缩略图
-            r'[A-Z]+-\d+-trailer\.',     # 预告片
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
+        file_type = _FILETYPE_MATCHER.search(filename)
+        if file_type:
+            return file_type.upper()
 
         # 检查文件名关键词
-        filename_lower = filename.lower()
+        if filename_lower is None:
+            filename_lower = filename.lower()
         if 'poster' in filename_lower:
             return 'POSTER'
         elif 'fanart' in filename_lower:
@@ -1019,241 +1324,38 @@ class MediaScanner:
 
         return None
 
-    def categorize_file(self, file_path: Path, media_info: MediaInfo):
-        """将文件分类到媒体信息中"""
-        ext = file_path.suffix.lower()
-        filename = file_path.name.lower()
-
-        # 主视频文件处理
-        if ext in self.video_extensions or ext in self.strm_extensions:
-            # 检查是否是主视频文件（没有特殊后缀）
-            file_type = self.extract_file_type(file_path.name)
-            if not file_type or file_type in ['MAIN', 'VIDEO']:
-                media_info.video_path = str(file_path)
-            elif file_type == 'TRAILER':
-                media_info.trailer_path = str(file_path)
-        elif ext == '.nfo':
-            media_info.nfo_path = str(file_path)
-        elif ext in self.image_extensions:
-            file_type = self.extract_file_type(file_path.name)
-            if file_type == 'POSTER' or any(keyword in filename for keyword in self.poster_keywords):
-                media_info.poster_path = str(file_path)
-            elif file_type == 'FANART' or any(keyword in filename for keyword in self.fanart_keywords):
-                media_info.fanart_path = str(file_path)
+    def categorize_file(self, file_path: str, media_info: MediaInfo, name: Optional[str] = None,
+                        entry: Optional[os.DirEntry] = None):
+        """将文件分类到媒体信息中，entry为扫描时的目录项（用于顺带取得trailer大小）"""
+        if name is None:
+            name = os.path.basename(file_path)
+        filename = name.lower()
+        dot = filename.rfind('.')
+        ext_class = self._ext_classes.get(filename[dot:] if dot > 0 else '')
+
+        if ext_class == 'video':
+            # 主视频（没有特殊后缀）或预告片
+            slot = _VIDEO_SLOTS.get(self.extract_file_type(name, filename))
+            if slot:
+                setattr(media_info, slot, file_path)
+                if slot == 'trailer_path':
+                    media_info.trailer_size = self._entry_size(entry)
+        elif ext_class == 'nfo':
+            media_info.nfo_path = file_path
+        elif ext_class == 'image':
+            file_type = self.extract_file_type(name, filename)
+            if file_type == 'POSTER' or (self._poster_re and self._poster_re.search(filename)):
+                media_info.poster_path = file_path
+            elif file_type == 'FANART' or (self._fanart_re and self._fanart_re.search(filename)):
+                media_info.fanart_path = file_path
             elif file_type == 'THUMB':
                 # 缩略图通常作为海报的补充
                 if not media_info.poster_path:
-                    media_info.poster_path = str(file_path)
-
-
-class NFOParser:
-    """NFO文件解析器"""
-
-    def __init__(self, config: Config):
-        self.config = config
-        self.defaults = config.get('nfo_parsing.defaults', {
-            'rating': 0.0,
-            'studio': '未知',
-            'director': '未知',
-            'plot': '暂无该部分信息'  # 硬编码的默认值，会被配置文件覆盖
-        })
-
-    def parse_nfo(self, nfo_path: str) -> dict:
-        """解析NFO文件，增加容错性"""
-        logging.info(f"开始解析NFO文件: {nfo_path}")
-
-        # 初始化数据结构，确保所有字段都存在
-        data = {
-            'title': '',
-            'actors': [],
-            'release_date': '',
-            'rating': self.defaults.get('rating', 0.0),
-            'plot': self.defaults.get('plot', '暂无该部分信息'),
-            'genre': [],  # 确保genre列表初始化
-            'studio': self.defaults.get('studio', '未知'),
-            'director': self.defaults.get('director', '未知')
-        }
-
-        try:
-            # 第一步：尝试标准解析
-            logging.debug(f"尝试标准XML解析: {nfo_path}")
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
-            result = self._extract_xml_data(root, data)
-            logging.info(f"标准解析成功: {nfo_path}")
-            return result
-
-        except (ParseError, ET.ParseError) as e:
-            logging.warning(f"NFO文件XML格式错误: {nfo_path} - {e}")
-            # 第二步：尝试修复XML文件并重新解析
-            try:
-                result = self._parse_nfo_with_recovery(nfo_path, data)
-                logging.info(f"修复解析成功: {nfo_path}")
-                return result
-            except Exception as recovery_error:
-                logging.error(f"修复解析也失败: {nfo_path} - {recovery_error}")
-                return data
-
-        except Exception as e:
-            logging.error(f"解析NFO文件完全失败: {nfo_path} - {e}")
-            # 打印详细的堆栈信息用于调试
-            import traceback
-            logging.debug(f"错误详情: {traceback.format_exc()}")
-            return data
-
-    def _extract_xml_data(self, root, data: dict) -> dict:
-        """从XML根节点提取数据"""
-        # 提取基本信息
-        title_elem = root.find('title')
-        if title_elem is not None and title_elem.text:
-            data['title'] = self._clean_text(title_elem.text)
-
-        # 提取原始标题
-        originaltitle_elem = root.find('originaltitle')
-        if originaltitle_elem is not None and originaltitle_elem.text:
-            data['originaltitle'] = self._clean_text(originaltitle_elem.text)
-
-        # 提取评分
-        rating_elem = root.find('rating')
-        if rating_elem is not None and rating_elem.text:
-            try:
-                rating = float(rating_elem.text)
-                # 统一格式化为一位小数，如果是整数则显示为X.0
-                data['rating'] = round(rating, 1)
-            except ValueError:
-                pass
-
-        # 提取发行日期
-        date_fields = ['releasedate', 'premiered', 'release']
-        for field in date_fields:
-            elem = root.find(field)
-            if elem is not None and elem.text:
-                data['release_date'] = self._clean_text(elem.text)
-                break
-
-        # 提取工作室
-        studio_elem = root.find('studio')
-        if studio_elem is not None and studio_elem.text:
-            data['studio'] = self._clean_text(studio_elem.text)
-
-        # 提取导演
-        director_elem = root.find('director')
-        if director_elem is not None and director_elem.text:
-            data['director'] = self._clean_text(director_elem.text)
-
-        # 提取剧情简介
-        plot_elem = root.find('plot')
-        if plot_elem is not None and plot_elem.text:
-            data['plot'] = self._clean_text(plot_elem.text)
-
-        # 提取类型
-        for genre_elem in root.findall('genre'):
-            if genre_elem.text:
-                genre = self._clean_text(genre.text)
-                if genre:
-                    data['genre'].append(genre)
-
-        # 提取演员
-        for actor_elem in root.findall('actor'):
-            name_elem = actor_elem.find('name')
-            if name_elem is not None and name_elem.text:
-                actor = self._clean_text(name_elem.text)
-                if actor:
-                    data['actors'].append(actor)
-
-        return data
-
-    def _clean_text(self, text: str) -> str:
-        """清理文本，去除HTML实体和无效字符"""
-        if not text:
-            return ''
-
-        # HTML实体解码
-        text = html.unescape(text)
-
-        # 移除无效字符
-        # 保留可打印字符、中文、日文等
-        import unicodedata
-        cleaned = ''.join(char for char in text if unicodedata.category(char)[0] != 'C')
-
-        return cleaned.strip()
-
-    def _parse_nfo_with_recovery(self, nfo_path: str, data: dict) -> dict:
-        """尝试修复损坏的NFO文件"""
-        try:
-            with open(nfo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # 尝试修复常见的XML问题
-            content = self._fix_xml_issues(content)
-
-            # 创建临时文件解析
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.nfo', delete=False, encoding='utf-8') as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-
-            try:
-                tree = ET.parse(temp_file_path)
-                root = tree.getroot()
-                # 创建新的数据字典，避免修改传入的data
-                recovered_data = {
-                    'title': '',
-                    'actors': [],
-                    'release_date': '',
-                    'rating': self.defaults.get('rating', 0.0),
-                    'plot': self.defaults.get('plot', '暂无该部分信息'),
-                    'genre': [],
-                    'studio': self.defaults.get('studio', '未知'),
-                    'director': self.defaults.get('director', '未知')
-                }
-                recovered_data = self._extract_xml_data(root, recovered_data)
-                logging.info(f"成功修复NFO文件: {nfo_path}")
-                return recovered_data
-            finally:
-                os.unlink(temp_file_path)
-
-        except Exception as e:
-            logging.warning(f"无法修复NFO文件 {nfo_path}: {e}")
-
-        return data
-
-    def _fix_xml_issues(self, content: str) -> str:
-        """修复常见的XML问题"""
-        # 移除或替换无效字符
-        import re
-
-        # 替换常见的XML无效字符
-        replacements = [
-            (r'[\x00-\x08\x0B\x0C\x0E-\x1F]'),  # 控制字符
-            (r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)'),  # 无效的实体引用
-        ]
-
-        for pattern in replacements:
-            content = re.sub(pattern, '', content)
-
-        # 确保XML标签闭合
-        content = re.sub(r'&(?=amp|lt|gt|quot|apos)', '&amp;', content)
+                    media_info.poster_path = file_path
 
-        return content
-
-
-# 导入修复的NFO解析器
-from nfo_parser_fixed import FixedNFOParser as NFOParser
-
-
-class MarkdownGenerator:
-    """Markdown文件生成器"""
 
-    def __init__(self, config: Config):
-        self.config = config
-        self.output_dir = Path(config.get('paths.output_directory', 'obsidian_output'))
-        self.template = self.load_template()
-        self.nfo_parser = NFOParser(config)
-
-    def load_template(self) -> str:
-        """加载Markdown模板 - 基于SONE-752.md的展示样式"""
-        template = """---
+# Markdown页面模板 - 基于SONE-752.md的展示样式（str.format语法）
+_MD_TEMPLATE = """---
 cssclasses:
   - film-page
 CN: {title_cn}
@@ -1569,49 +1671,64 @@ dv.header(2, "🗒️ 备注");
 dv.paragraph("> {additional_note}");
 ```
 """
-        return template
+
+
+def _split_template(template: str) -> tuple:
+    """预先把format模板拆成(固定片段, 占位符名)序列，渲染时直接拼接，省去逐次解析占位符"""
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"模板占位符不支持格式说明: {field_name}")
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def _render_template(parts: tuple, values: dict) -> str:
+    """按预拆分的模板片段填充数据，等价于template.format(**values)"""
+    chunks = []
+    for literal, field_name in parts:
+        chunks.append(literal)
+        if field_name is not None:
+            chunks.append(str(values[field_name]))
+    return ''.join(chunks)
+
+
+class MarkdownGenerator:
+    """Markdown文件生成器"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.output_dir = Path(config.get('paths.output_directory', 'obsidian_output'))
+        self.template = self.load_template()
+        self._template_parts = _split_template(self.template)
+        self.nfo_parser = NFOParser(config)
+        # 预览图模式JS只依赖配置，构造时生成一次
+        self._preview_patterns_js = self._build_preview_patterns_js()
+        # 绝对路径前缀预先标准化（正斜杠、以/结尾），格式化路径时直接切片
+        absolute_path_prefix = config.get('markdown.links.absolute_path_prefix', '')
+        self._abs_prefix = (os.path.abspath(absolute_path_prefix).replace('\\', '/').rstrip('/') + '/'
+                            if absolute_path_prefix else '')
+        # 最小trailer文件大小，默认500KB
+        self._min_trailer_size = config.get('advanced.file_size_limits.min_trailer_size', 500 * 1024)
+        # 文件生成时间按批次记录，同一次运行生成的文件共用
+        datetime_format = config.get('basic.datetime_format', "%Y-%m-%d %H:%M:%S")
+        self._run_timestamp = datetime.now().strftime(datetime_format)
+        # 关键词过滤：把排除列表编译成一个正则，逐个关键词只需扫描一次
+        exclude_keywords = config.get('filtering', {}).get('exclude_keywords', [])
+        self._exclude_re = re.compile('|'.join(map(re.escape, exclude_keywords))) if exclude_keywords else None
+
+    def load_template(self) -> str:
+        """加载Markdown模板 - 基于SONE-752.md的展示样式"""
+        return _MD_TEMPLATE
 
     def generate_markdown(self, media_info: MediaInfo) -> str:
         """生成Markdown内容 - 基于SONE-752.md样式"""
 
         # 解析NFO文件
-        nfo_data = {}
-        if media_info.nfo_path and os.path.exists(media_info.nfo_path):
-            nfo_data = self.nfo_parser.parse_nfo(media_info.nfo_path)
+        nfo_data = load_nfo_data(media_info, self.nfo_parser)
 
         # 获取配置
         path_mode = self.config.get('markdown.links.path_mode', 'absolute')
-        absolute_path_prefix = self.config.get('markdown.links.absolute_path_prefix', '')
-
-        def format_media_path(file_path: str) -> str:
-            """格式化媒体文件路径为从jav_store开始的相对路径"""
-            if not file_path:
-                return ""
-
-            # 获取绝对路径
-            abs_path = os.path.abspath(file_path)
-
-            # 如果配置了绝对路径前缀，移除它
-            if absolute_path_prefix and abs_path.startswith(absolute_path_prefix):
-                relative = abs_path.replace(absolute_path_prefix, '').lstrip('/\\')
-            else:
-                relative = abs_path
-
-            # 标准化路径分隔符
-            relative = relative.replace('\\', '/')
-
-            # 如果路径不以"jav_store"开头，添加它
-            if not relative.startswith('jav_store'):
-                # 如果路径包含jav_store，从jav_store开始截取
-                if 'jav_store' in relative:
-                    # 找到jav_store在路径中的位置
-                    jav_index = relative.find('jav_store')
-                    relative = relative[jav_index:]
-                else:
-                    # 如果不包含jav_store，假设它在source下
-                    relative = 'jav_store/source/' + relative
-
-            return relative
 
         # 处理演员信息
         actors = nfo_data.get('actors', media_info.actors)
@@ -1639,7 +1756,7 @@ dv.paragraph("> {additional_note}");
         if series:
             # 使用YAML数组格式，类似SONE-752.md中的格式
             # 转义Windows路径中的反斜杠和特殊字符
-            series_escaped = series.replace('\\', '\\\\').replace('"', '\\"')
+            series_escaped = series.translate(_YAML_ESCAPE)
             series_data = f"  - - {series_escaped}"
         else:
             series_data = "  - []"
@@ -1652,7 +1769,7 @@ dv.paragraph("> {additional_note}");
         cover_path = ""
         if media_info.poster_path:
             # 使用配置的路径模式格式化路径
-            cover_path = format_media_path(media_info.poster_path)
+            cover_path = self._format_media_path(media_info.poster_path)
         else:
             cover_path = ""  # 留空，让dataviewjs脚本处理"No Cover"情况
 
@@ -1668,10 +1785,8 @@ dv.paragraph("> {additional_note}");
         if not plot.strip():
             plot = plot_default
 
-        # 生成文件创建时间
-        datetime_format = self.config.get('basic.datetime_format', "%Y-%m-%d %H:%M:%S")
-        creation_time = datetime.now().strftime(datetime_format)
-        additional_note = f"文件生成时间: {creation_time}"
+        # 文件创建时间（本次运行的时间）
+        additional_note = f"文件生成时间: {self._run_timestamp}"
 
         # 获取根目录配置
         root_dir = self.config.get('dataview.root_dir', 'jav_store/source')
@@ -1692,7 +1807,7 @@ dv.paragraph("> {additional_note}");
             'series_data': series_data,
             'keywords_data': keywords_data,
             'cover_path': cover_path,
-            'fanart_path': format_media_path(media_info.fanart_path) if media_info.fanart_path else "",
+            'fanart_path': self._format_media_path(media_info.fanart_path) if media_info.fanart_path else "",
             'root_dir': root_dir,
             'years_directory': years_directory,
             'ranks_directory': ranks_directory,
@@ -1700,20 +1815,44 @@ dv.paragraph("> {additional_note}");
             'keywords_directory': keywords_directory,
             'trailer_section': trailer_section,
             'play_button_section': play_button_section,
-            'preview_patterns_js': self._generate_preview_patterns_js(),
+            'preview_patterns_js': self._preview_patterns_js,
             'plot_summary': plot,
             'additional_note': additional_note  # 文件生成时间
         }
 
-        content = self.template.format(**template_data)
+        content = _render_template(self._template_parts, template_data)
 
         return content
 
+    def _format_media_path(self, file_path: str) -> str:
+        """格式化媒体文件路径为从jav_store开始的相对路径"""
+        if not file_path:
+            return ""
+
+        # 获取绝对路径并标准化路径分隔符
+        relative = os.path.abspath(file_path).replace('\\', '/')
+
+        # 如果配置了绝对路径前缀，移除它
+        abs_prefix = self._abs_prefix
+        if abs_prefix and relative.startswith(abs_prefix):
+            relative = relative[len(abs_prefix):]
+
+        # 如果路径不以"jav_store"开头，添加它
+        if not relative.startswith('jav_store'):
+            # 如果路径包含jav_store，从jav_store开始截取
+            jav_index = relative.find('jav_store')
+            if jav_index >= 0:
+                relative = relative[jav_index:]
+            else:
+                # 如果不包含jav_store，假设它在source下
+                relative = 'jav_store/source/' + relative
+
+        return relative
+
     def _extract_year_from_date(self, date_str: str) -> str:
         """从日期字符串中提取年份"""
-        import re
         # 匹配四种年份格式: 2025, 2025-01-01, 01/01/2025, 2025年01月01日
-        year_match = re.search(r'(\d{4})', date_str)
+        year_match = _YEAR_RE.search(date_str)
         return year_match.group(1) if year_match else "未知"
 
     def _format_keywords(self, genres: List[str]) -> str:
@@ -1722,49 +1861,27 @@ dv.paragraph("> {additional_note}");
             return "[]"
 
         # 过滤关键词
-        filtering_config = self.config.get('filtering', {})
-        exclude_keywords = filtering_config.get('exclude_keywords', [])
-
-        filtered_genres = []
-        for genre in genres:
-            should_exclude = False
-            for keyword in exclude_keywords:
-                if keyword in genre:
-                    should_exclude = True
-                    break
-            if not should_exclude:
-                filtered_genres.append(genre)
-
+        exclude_re = self._exclude_re
+        filtered_genres = [g for g in genres if not (exclude_re and exclude_re.search(g))]
         if not filtered_genres:
             return "[]"
 
-        # 获取最大关键词数量配置，设置为更大的值以包含所有关键词
-        max_keywords = self.config.get('content.max_keywords', 20)
-
-        # 格式化为YAML数组，类似SONE-752.md中的格式
-        if not filtered_genres:
-            return "  - []"
-
-        keyword_lines = []
-        for genre in filtered_genres[:max_keywords]:  # 使用配置的最大关键词数量
-            # 转义特殊字符
-            genre_escaped = genre.replace('\\', '\\\\').replace('"', '\\"')
-            keyword_lines.append(f"  - - - {genre_escaped}")
+        # 获取最大关键词数量配置，设置为更大的值以包含所有关键词
+        max_keywords = self.config.get('content.max_keywords', 20)
 
-        return "\n".join(keyword_lines)
+        # 格式化为YAML数组，类似SONE-752.md中的格式
+        # 使用配置的最大关键词数量，并转义特殊字符
+        return "\n".join(f"  - - - {genre.translate(_YAML_ESCAPE)}"
+                         for genre in filtered_genres[:max_keywords])
 
     def _format_actors(self, actors: List[str]) -> str:
         """格式化演员为YAML数组格式，类似关键词格式"""
         if not actors:
             return "  - []"
-        actor_lines = []
-        for actor in actors:
-            # 转义特殊字符
-            actor_escaped = actor.replace('\\', '\\\\').replace('"', '\\"')
-            actor_lines.append(f"  - - - {actor_escaped}")
-        return "\n".join(actor_lines)
-
-    def _generate_preview_patterns_js(self) -> str:
+        # 转义特殊字符
+        return "\n".join(f"  - - - {actor.translate(_YAML_ESCAPE)}" for actor in actors)
+
+    def _build_preview_patterns_js(self) -> str:
         """生成预览图模式的JavaScript配置"""
         preview_patterns = self.config.get('dataview.preview_patterns', [])
 
@@ -1842,30 +1959,26 @@ dv.paragraph("> {additional_note}");
         if not media_info.trailer_path:
             return ""
 
-        # 检查trailer文件是否存在
+        # 优先使用扫描时取得的大小，没有时才stat（一次）
         trailer_path = media_info.trailer_path
-        if not os.path.exists(trailer_path):
+        try:
+            file_size = media_info.trailer_size
+            if file_size is None:
+                file_size = os.stat(trailer_path).st_size
+        except FileNotFoundError:
             logging.warning(f"Trailer文件不存在: {trailer_path}")
             return ""
-
-        # 检查trailer文件大小，如果小于配置的最小值则不显示
-        try:
-            file_size = os.path.getsize(trailer_path)
-            # 从配置文件获取最小trailer文件大小，默认500KB
-            min_size = self.config.get('advanced.file_size_limits.min_trailer_size', 500 * 1024)
-            min_size_kb = min_size / 1024  # 转换为KB用于日志显示
-            if file_size < min_size:
-                file_size_kb = file_size / 1024
-                logging.info(f"Trailer文件过小，跳过显示: {trailer_path} ({file_size_kb:.1f}KB < {min_size_kb:.0f}KB)")
-                return ""
         except OSError as e:
             logging.warning(f"无法获取trailer文件大小: {trailer_path} - {e}")
             return ""
 
-        # 获取trailer文件的绝对路径
-        trailer_abs_path = os.path.abspath(trailer_path)
-        # 格式化为从vault根目录的相对路径
-        trailer_vault_path = self._format_media_path_for_trailer(trailer_path)
+        # 如果小于配置的最小值则不显示
+        if file_size < self._min_trailer_size:
+            min_size_kb = self._min_trailer_size / 1024  # 转换为KB用于日志显示
+            file_size_kb = file_size / 1024
+            logging.info(f"Trailer文件过小，跳过显示: {trailer_path} ({file_size_kb:.1f}KB < {min_size_kb:.0f}KB)")
+            return ""
+
         trailer_filename = os.path.basename(trailer_path)
 
         return f'''## 🎥 预告片
@@ -1874,39 +1987,6 @@ dv.paragraph("> {additional_note}");
 
 '''
 
-    def _format_media_path_for_trailer(self, file_path: str) -> str:
-        """格式化媒体文件路径为trailer显示用的相对路径"""
-        if not file_path:
-            return ""
-
-        # 获取绝对路径
-        abs_path = os.path.abspath(file_path)
-
-        # 获取配置的绝对路径前缀
-        absolute_path_prefix = self.config.get('markdown.links.absolute_path_prefix', '')
-
-        # 如果配置了绝对路径前缀，移除它
-        if absolute_path_prefix and abs_path.startswith(absolute_path_prefix):
-            relative = abs_path.replace(absolute_path_prefix, '').lstrip('/\\')
-        else:
-            relative = abs_path
-
-        # 标准化路径分隔符
-        relative = relative.replace('\\', '/')
-
-        # 如果路径不以"jav_store"开头，添加它
-        if not relative.startswith('jav_store'):
-            # 如果路径包含jav_store，从jav_store开始截取
-            if 'jav_store' in relative:
-                # 找到jav_store在路径中的位置
-                jav_index = relative.find('jav_store')
-                relative = relative[jav_index:]
-            else:
-                # 如果不包含jav_store，假设它在source下
-                relative = 'jav_store/source/' + relative
-
-        return relative
-
     def _generate_play_button_section(self, media_info: MediaInfo, nfo_data: dict) -> str:
         """生成播放模块部分"""
         if not media_info.video_path:
@@ -1974,19 +2054,19 @@ action:
         """保存Markdown文件，确保使用基础番号作为文件名"""
         # 确保文件名是基础番号，不包含后缀
         base_code = media_info.code
-        # 如果番号包含后缀，提取基础部分
-        if '-' in base_code and len(base_code.split('-')) > 2:
-            # 例如: EDRG-009-F -> EDRG-009
-            parts = base_code.split('-')
-            base_code = f"{parts[0]}-{parts[1]}"
+        # 如果番号包含后缀，提取基础部分（前两段）
+        # 例如: EDRG-009-F -> EDRG-009
+        head, _, rest = base_code.partition('-')
+        middle, sep, _ = rest.partition('-')
+        if sep:
+            base_code = f"{head}-{middle}"
 
         filename = f"{base_code}.md"
         filepath = self.output_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_text_file(filepath, content)
 
-        logging.info(f"已生成Markdown文件: {filepath}")
+        logging.info("已生成Markdown文件: %s", filepath)
 
 
 def main():
@@ -2005,13 +2085,13 @@ def main():
 
         # 重新设置日志级别（确保命令行参数覆盖后生效）
         log_level = config.config.get('advanced', {}).get('log_level', 'INFO')
-        logging.getLogger().setLevel(getattr(logging, log_level))
+        logging.getLogger().setLevel(_LOG_LEVELS.get(log_level, logging.INFO))
 
         # 命令行参数覆盖配置文件
         if args.source_dir:
-            config.config['paths']['source_directories'] = [args.source_dir]
+            config.set('paths.source_directories', [args.source_dir])
         if args.output_dir:
-            config.config['paths']['output_directory'] = args.output_dir
+            config.set('paths.output_directory', args.output_dir)
 
         logging.info("开始扫描媒体文件...")
 
@@ -2030,11 +2110,8 @@ def main():
         # 创建生成器
         generator = MarkdownGenerator(config)
 
-        # 生成Markdown文件
-        for code, media_info in media_groups.items():
-            logging.info(f"正在处理: {code}")
-            content = generator.generate_markdown(media_info)
-            generator.save_markdown(media_info, content)
+        # 生成Markdown文件（同时解析并缓存NFO数据，供后续页面生成使用）
+        generate_markdown_files(media_groups, generator, config)
 
         # 生成演员页面
         logging.info("开始生成演员页面...")
@@ -2050,12 +2127,7 @@ def main():
         logging.info("开始使用独立分类生成器生成页面...")
         independent_generator = IndependentCategoryGenerator(config)
 
-        # 生成各类独立页面
-        independent_generator.generate_all_actor_pages()
-        independent_generator.generate_all_keywords_pages()
-        independent_generator.generate_all_ranks_pages()
-        independent_generator.generate_all_series_pages()
-        independent_generator.generate_all_years_pages()
+        independent_generator.generate_all_pages()
 
         output_dir = config.get('paths.output_directory', 'obsidian_output')
         logging.info(f"完成! 已生成 {len(media_groups)} 个Markdown文件到: {output_dir}")
@@ -2065,493 +2137,124 @@ def main():
         raise
 
 
-class IndependentCategoryGenerator:
-    """独立的分类页面生成器 - 基于films文件夹的MD文件内容生成分类页面"""
-
-    def __init__(self, config: Config):
-        self.config = config
-        self.base_dir = Path(config.get('paths.output_directory', 'jav_store')).parent
-        self.films_dir = self.base_dir / 'films'
-
-    def generate_all_actor_pages(self):
-        """读取films文件夹中的Actor属性，为每个演员生成页面"""
-        logging.info("开始独立生成演员页面...")
-
-        # 收集所有演员及其作品
-        actor_works = {}
-
-        # 扫描films文件夹中的所有MD文件
-        for md_file in self.films_dir.glob('*.md'):
-            try:
-                # 读取MD文件的frontmatter
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # 提取frontmatter
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter_text = content[3:frontmatter_end]
-                        actor_data = self._extract_actor_from_frontmatter(frontmatter_text)
-
-                        if actor_data:
-                            for actor in actor_data:
-                                if actor and actor not in ["", "未知", None]:
-                                    if actor not in actor_works:
-                                        actor_works[actor] = []
-                                    actor_works[actor].append(md_file.stem)
-
-            except Exception as e:
-                logging.warning(f"处理文件 {md_file} 时出错: {e}")
-
-        # 为每个演员生成页面
-        actor_dir = self.base_dir / 'actor'
-        actor_dir.mkdir(exist_ok=True)
-
-        for actor, works in actor_works.items():
-            self._generate_actor_page(actor, works)
-
-        logging.info(f"已生成 {len(actor_works)} 个演员页面")
-
-    def generate_all_keywords_pages(self):
-        """读取films文件夹中的Keywords属性，为每个关键词生成页面"""
-        logging.info("开始独立生成关键词页面...")
-
-        keyword_works = {}
-
-        for md_file in self.films_dir.glob('*.md'):
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter_text = content[3:frontmatter_end]
-                        keywords_data = self._extract_keywords_from_frontmatter(frontmatter_text)
-
-                        if keywords_data:
-                            for keyword in keywords_data:
-                                if keyword and keyword not in ["", "未知", None]:
-                                    if keyword not in keyword_works:
-                                        keyword_works[keyword] = []
-                                    keyword_works[keyword].append(md_file.stem)
-
-            except Exception as e:
-                logging.warning(f"处理文件 {md_file} 时出错: {e}")
-
-        # 只为有作品的关键词生成页面
-        valid_keyword_works = {k: v for k, v in keyword_works.items() if len(v) > 0}
-
-        keywords_dir = self.base_dir / 'keywords'
-        keywords_dir.mkdir(exist_ok=True)
-
-        for keyword, works in valid_keyword_works.items():
-            self._generate_keywords_page(keyword, works)
-
-        logging.info(f"已生成 {len(valid_keyword_works)} 个关键词页面")
-
-    def generate_all_ranks_pages(self):
-        """读取films文件夹中的VideoRank属性，为每个评分生成页面"""
-        logging.info("开始独立生成评分页面...")
-
-        rank_works = {}
-
-        for md_file in self.films_dir.glob('*.md'):
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter_text = content[3:frontmatter_end]
-                        rank_data = self._extract_rank_from_frontmatter(frontmatter_text)
-
-                        if rank_data and rank_data not in ["", "未知", None]:
-                            if rank_data not in rank_works:
-                                rank_works[rank_data] = []
-                            rank_works[rank_data].append(md_file.stem)
-
-            except Exception as e:
-                logging.warning(f"处理文件 {md_file} 时出错: {e}")
-
-        ranks_dir = self.base_dir / 'ranks'
-        ranks_dir.mkdir(exist_ok=True)
-
-        for rank, works in rank_works.items():
-            self._generate_rank_page(rank, works)
-
-        logging.info(f"已生成 {len(rank_works)} 个评分页面")
-
-    def generate_all_series_pages(self):
-        """读取films文件夹中的Series属性，为每个系列生成页面"""
-        logging.info("开始独立生成系列页面...")
-
-        series_works = {}
-
-        for md_file in self.films_dir.glob('*.md'):
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter_text = content[3:frontmatter_end]
-                        series_data = self._extract_series_from_frontmatter(frontmatter_text)
-
-                        if series_data:
-                            for series in series_data:
-                                if series and series not in ["", "未知", None]:
-                                    if series not in series_works:
-                                        series_works[series] = []
-                                    series_works[series].append(md_file.stem)
-
-            except Exception as e:
-                logging.warning(f"处理文件 {md_file} 时出错: {e}")
-
-        series_dir = self.base_dir / 'series'
-        series_dir.mkdir(exist_ok=True)
-
-        for series, works in series_works.items():
-            self._generate_series_page(series, works)
-
-        logging.info(f"已生成 {len(series_works)} 个系列页面")
-
-    def generate_all_years_pages(self):
-        """读取films文件夹中的Year属性，为每个年份生成页面"""
-        logging.info("开始独立生成年份页面...")
-
-        year_works = {}
-
-        for md_file in self.films_dir.glob('*.md'):
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter_text = content[3:frontmatter_end]
-                        year_data = self._extract_year_from_frontmatter(frontmatter_text)
-
-                        if year_data and year_data not in ["", "未知", None]:
-                            if year_data not in year_works:
-                                year_works[year_data] = []
-                            year_works[year_data].append(md_file.stem)
-
-            except Exception as e:
-                logging.warning(f"处理文件 {md_file} 时出错: {e}")
-
-        years_dir = self.base_dir / 'years'
-        years_dir.mkdir(exist_ok=True)
-
-        for year, works in year_works.items():
-            self._generate_year_page(year, works)
-
-        logging.info(f"已生成 {len(year_works)} 个年份页面")
-
-    def _extract_actor_from_frontmatter(self, frontmatter_text: str) -> List[str]:
-        """从frontmatter中提取Actor属性"""
-        actors = []
-        found_actor_section = False
-
-        for line in frontmatter_text.split('\n'):
-            line = line.strip()
-            if line.startswith('Actor:'):
-                found_actor_section = True
-                # 处理单行格式：Actor: actor_name
-                actor_name = line.replace('Actor:', '').strip()
-                if actor_name and actor_name not in ['-', '[]']:
-                    actors.append(actor_name)
-            elif found_actor_section and line.startswith('- - -'):
-                # 处理嵌套数组格式：- - - actor_name
-                actor_name = line.replace('- - -', '').strip()
-                if actor_name:
-                    actors.append(actor_name)
-            elif found_actor_section and not line.startswith('-') and line and ':' in line:
-                # 遇到新的字段，结束Actor解析
-                found_actor_section = False
-
-        return actors
-
-    def _extract_keywords_from_frontmatter(self, frontmatter_text: str) -> List[str]:
-        """从frontmatter中提取Keywords属性"""
-        keywords = []
-        found_keywords_section = False
-
-        for line in frontmatter_text.split('\n'):
-            line = line.strip()
-            if line.startswith('Keywords:'):
-                found_keywords_section = True
-                # 处理单行格式：Keywords: keyword_name
-                keyword_name = line.replace('Keywords:', '').strip()
-                if keyword_name and keyword_name not in ['-', '[]']:
-                    keywords.append(keyword_name)
-            elif found_keywords_section and line.startswith('- - -'):
-                # 处理嵌套数组格式：- - - keyword_name
-                keyword_name = line.replace('- - -', '').strip()
-                if keyword_name:
-                    keywords.append(keyword_name)
-            elif found_keywords_section and not line.startswith('-') and line and ':' in line:
-                # 遇到新的字段，结束Keywords解析
-                found_keywords_section = False
-
-        return keywords
-
-    def _extract_rank_from_frontmatter(self, frontmatter_text: str) -> str:
-        """从frontmatter中提取VideoRank属性，并统一格式化为一位小数"""
-        for line in frontmatter_text.split('\n'):
-            if line.strip().startswith('VideoRank:'):
-                rank_str = line.replace('VideoRank:', '').strip()
-                try:
-                    rank = float(rank_str)
-                    # 统一格式化为一位小数
-                    return str(round(rank, 1))
-                except ValueError:
-                    return rank_str
-        return ""
-
-    def _extract_series_from_frontmatter(self, frontmatter_text: str) -> List[str]:
-        """从frontmatter中提取Series属性"""
-        series_list = []
-        found_series_section = False
-
-        for line in frontmatter_text.split('\n'):
-            line = line.strip()
-            if line.startswith('Series:'):
-                found_series_section = True
-                # 处理单行格式：Series: series_name
-                series_name = line.replace('Series:', '').strip()
-                if series_name and series_name not in ['-', '[]']:
-                    series_list.append(series_name)
-            elif found_series_section and (line.startswith('- - -') or line.startswith('- -')):
-                # 处理嵌套数组格式：- - - series_name 或 - - series_name
-                series_name = line.replace('- - -', '').replace('- -', '').strip()
-                if series_name:
-                    series_list.append(series_name)
-            elif found_series_section and not line.startswith('-') and line and ':' in line:
-                # 遇到新的字段，结束Series解析
-                found_series_section = False
-
-        return series_list
-
-    def _extract_year_from_frontmatter(self, frontmatter_text: str) -> str:
-        """从frontmatter中提取Year属性"""
-        for line in frontmatter_text.split('\n'):
-            if line.strip().startswith('Year:'):
-                year = line.replace('Year:', '').strip()
-                return year
-        return ""
-
-    def _generate_actor_page(self, actor: str, works: List[str]):
-        """生成演员页面"""
-        actor_file = self.base_dir / 'actor' / f"{actor}.md"
-        content = self._generate_preview_style_page('actor', actor, works)
-
-        with open(actor_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logging.info(f"已生成演员页面: {actor_file}")
-
-    def _generate_keywords_page(self, keyword: str, works: List[str]):
-        """生成关键词页面"""
-        keyword_file = self.base_dir / 'keywords' / f"{keyword}.md"
-        content = self._generate_preview_style_page('keywords', keyword, works)
-
-        with open(keyword_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logging.info(f"已生成关键词页面: {keyword_file}")
-
-    def _generate_rank_page(self, rank: str, works: List[str]):
-        """生成评分页面"""
-        rank_file = self.base_dir / 'ranks' / f"{rank}.md"
-        content = self._generate_preview_style_page('ranks', rank, works)
-
-        with open(rank_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logging.info(f"已生成评分页面: {rank_file}")
-
-    def _generate_series_page(self, series: str, works: List[str]):
-        """生成系列页面"""
-        series_file = self.base_dir / 'series' / f"{series}.md"
-        content = self._generate_preview_style_page('series', series, works)
-
-        with open(series_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logging.info(f"已生成系列页面: {series_file}")
-
-    def _generate_year_page(self, year: str, works: List[str]):
-        """生成年份页面"""
-        year_file = self.base_dir / 'years' / f"{year}.md"
-        content = self._generate_preview_style_page('years', year, works)
-
-        with open(year_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logging.info(f"已生成年份页面: {year_file}")
-
-    def _generate_preview_style_page(self, category_type: str, category_value: str, works: List[str]) -> str:
-        """生成preview.md样式的分类页面内容"""
-
-        # 根据分类类型设置配置
-        type_configs = {
-            'actor': {
-                'title': f"👰 演员: {category_value}",
-                'icon': '👰',
-                'filter_field': 'Actor',
-                'filter_value': category_value
-            },
-            'keywords': {
-                'title': f"🏷️ 关键词: {category_value}",
-                'icon': '🏷️',
-                'filter_field': 'Keywords',
-                'filter_value': category_value
-            },
-            'ranks': {
-                'title': f"⭐ 评分: {category_value}分",
-                'icon': '⭐',
-                'filter_field': 'VideoRank',
-                'filter_value': category_value
-            },
-            'series': {
-                'title': f"📺 系列: {category_value}",
-                'icon': '📺',
-                'filter_field': 'Series',
-                'filter_value': category_value
-            },
-            'years': {
-                'title': f"📅 年份: {category_value}年",
-                'icon': '📅',
-                'filter_field': 'Year',
-                'filter_value': category_value
-            }
-        }
-
-        config = type_configs.get(category_type, type_configs['actor'])
-
-        content = f"""---
-cssclasses:
-  - cards-cols-6
-  - cards-cover
-  - table-max
-  - cards
----
-
-# {config['title']}
-
-```dataviewjs
+# 独立分类页面标题，按分类类型区分
+_PREVIEW_PAGE_TITLES = {
+    'actor': "👰 演员: {}",
+    'keywords': "🏷️ 关键词: {}",
+    'ranks': "⭐ 评分: {}分",
+    'series': "📺 系列: {}",
+    'years': "📅 年份: {}年",
+}
 
-// === 分类专属页面配置 ===
-const CATEGORY_TYPE = "{category_type}";
-const CATEGORY_VALUE = "{category_value}";
-const ROOT = "jav_store";
-const META_DIR = `${{ROOT}}/films`;
-const COVER_DIR = `${{ROOT}}/source`;
+# 独立分类页面的dataviewjs主体（分类常量之后的部分），所有分类页面共用
+_PREVIEW_PAGE_JS = """const ROOT = "jav_store";
+const META_DIR = `${ROOT}/films`;
+const COVER_DIR = `${ROOT}/source`;
 
 // 分类目录常量
-const ACTOR_DIR = `${{ROOT}}/actor`;
-const YEARS_DIR = `${{ROOT}}/years`;
-const RANKS_DIR = `${{ROOT}}/ranks`;
-const SERIES_DIR = `${{ROOT}}/series`;
-const KEYWORDS_DIR = `${{ROOT}}/keywords`;
+const ACTOR_DIR = `${ROOT}/actor`;
+const YEARS_DIR = `${ROOT}/years`;
+const RANKS_DIR = `${ROOT}/ranks`;
+const SERIES_DIR = `${ROOT}/series`;
+const KEYWORDS_DIR = `${ROOT}/keywords`;
 
 // === 获取分类页面数据 ===
-const allPages = dv.pages(`"${{META_DIR}}"`);
+const allPages = dv.pages(`"${META_DIR}"`);
 let categoryPages = filterByCategory(allPages).sort(p => p.Code ?? "", "asc");
 
 // 如果过滤结果为空，使用备用过滤逻辑
-if (categoryPages.length === 0) {{
+if (categoryPages.length === 0) {
   let simpleFiltered = [];
-  if (CATEGORY_TYPE === 'keywords') {{
+  if (CATEGORY_TYPE === 'keywords') {
     // 关键词的备用过滤：直接检查Keywords字段
-    simpleFiltered = allPages.filter(p => {{
+    simpleFiltered = allPages.filter(p => {
       const keywords = p.Keywords || [];
-      const flattenKeywords = (arr) => {{
+      const flattenKeywords = (arr) => {
         let result = [];
-        for (const item of arr) {{
-          if (Array.isArray(item)) {{
+        for (const item of arr) {
+          if (Array.isArray(item)) {
             result = result.concat(flattenKeywords(item));
-          }} else if (typeof item === 'string') {{
+          } else if (typeof item === 'string') {
             result.push(item);
-          }}
-        }}
+          }
+        }
         return result;
-      }};
+      };
       const keywordArray = flattenKeywords(keywords);
-      return keywordArray.some(kw => {{
-        if (typeof kw === 'object' && kw.path) {{
+      return keywordArray.some(kw => {
+        if (typeof kw === 'object' && kw.path) {
           return kw.path.split('/').pop() === CATEGORY_VALUE;
-        }} else if (typeof kw === 'string') {{
+        } else if (typeof kw === 'string') {
           const cleanKw = kw.replace(/^\\[\\[|\\]\\]$/g, '').split('|').pop().trim();
           return cleanKw === CATEGORY_VALUE;
-        }}
+        }
         return false;
-      }});
-    }});
-  }} else if (CATEGORY_TYPE === 'actor') {{
-    simpleFiltered = allPages.filter(p => {{
+      });
+    });
+  } else if (CATEGORY_TYPE === 'actor') {
+    simpleFiltered = allPages.filter(p => {
       const actor = p.Actor;
-      if (Array.isArray(actor)) {{
-        const flattenActors = (arr) => {{
+      if (Array.isArray(actor)) {
+        const flattenActors = (arr) => {
           let result = [];
-          for (const item of arr) {{
-            if (Array.isArray(item)) {{
+          for (const item of arr) {
+            if (Array.isArray(item)) {
               result = result.concat(flattenActors(item));
-            }} else if (typeof item === 'string' && item.trim()) {{
+            } else if (typeof item === 'string' && item.trim()) {
               result.push(item.trim());
-            }}
-          }}
+            }
+          }
           return result;
-        }};
+        };
         const actorList = flattenActors(actor);
         return actorList.includes(CATEGORY_VALUE);
-      }} else if (actor && typeof actor === 'string') {{
+      } else if (actor && typeof actor === 'string') {
         return actor === CATEGORY_VALUE;
-      }}
+      }
       return false;
-    }});
-  }} else if (CATEGORY_TYPE === 'years') {{
+    });
+  } else if (CATEGORY_TYPE === 'years') {
     // 年份的备用过滤：直接检查Year字段
     simpleFiltered = allPages.filter(p => String(p.Year) === CATEGORY_VALUE);
-  }} else {{
+  } else {
     simpleFiltered = allPages.filter(p => String(p[CATEGORY_TYPE.charAt(0).toUpperCase() + CATEGORY_TYPE.slice(1)]) === CATEGORY_VALUE);
-  }}
-  if (simpleFiltered.length > 0) {{
+  }
+  if (simpleFiltered.length > 0) {
     categoryPages = simpleFiltered;
-  }}
-}}
+  }
+}
 
 // === 统计信息 ===
 const totalCount = categoryPages.length;
 
 // 根据分类类型显示不同的统计信息
-let statsText = `**📊 作品总数**: ${{totalCount}} 部`;
+let statsText = `**📊 作品总数**: ${totalCount} 部`;
 
 // 不再显示重复的分类信息，标题已经包含了完整信息
 
 dv.paragraph(statsText);
 
 // === 通用：把"文件名/相对路径/维基链接/Link对象"解析为 Obsidian 文件对象 ===
-function resolveFile(anyPathLike, base){{
+function resolveFile(anyPathLike, base){
   if (!anyPathLike) return null;
-  if (typeof anyPathLike === "string"){{
+  if (typeof anyPathLike === "string"){
     const s = anyPathLike.trim();
     // [[...]] 维基链接
     const m = s.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|([^\\]]+))?\\]\\]$/);
     if (m) return app.metadataCache.getFirstLinkpathDest(m[1], base);
     // 普通相对路径
     return app.vault.getAbstractFileByPath(s);
-  }}
+  }
   // Dataview 的链接对象
-  if (anyPathLike?.path){{
+  if (anyPathLike?.path){
     return app.vault.getAbstractFileByPath(anyPathLike.path)
         ?? app.metadataCache.getFirstLinkpathDest(anyPathLike.path, base);
-  }}
+  }
   return null;
-}}
+}
 
 // === 创建内部链接元素 ===
-function makeILink(targetPathOrName, label, sourcePath){{
+function makeILink(targetPathOrName, label, sourcePath){
   const t = String(targetPathOrName ?? "").trim();
   const src = sourcePath ?? dv.current().file.path;
   const dest = app.metadataCache.getFirstLinkpathDest(t, src);
@@ -2562,10 +2265,10 @@ function makeILink(targetPathOrName, label, sourcePath){{
   a.setAttribute('data-href', href);
   a.textContent = label ?? (dest ? dest.basename : t);
   return a;
-}}
+}
 
 // === 封面查找：从source目录的番号文件夹中查找封面 ===
-function findCoverForPage(p){{
+function findCoverForPage(p){
   let v = p.Cover;
   if (!v) return null;
 
@@ -2575,90 +2278,90 @@ function findCoverForPage(p){{
 
   // 兜底：在source目录的番号文件夹中查找封面
   const code = p.Code;
-  if (code) {{
+  if (code) {
     // 生成可能的目录名称变体
-    const getDirectoryVariants = (baseCode) => {{
+    const getDirectoryVariants = (baseCode) => {
       const variants = [baseCode];
 
       // 如果以数字结尾，尝试添加-C后缀
-      if (/\\d+$/.test(baseCode)) {{
+      if (/\\d+$/.test(baseCode)) {
         variants.push(baseCode + '-C');
-      }}
+      }
 
       // 如果已经以-C结尾，也尝试不带-C的版本
-      if (baseCode.endsWith('-C')) {{
+      if (baseCode.endsWith('-C')) {
         variants.push(baseCode.slice(0, -2));
-      }}
+      }
 
       return variants;
-    }};
+    };
 
     const directoryVariants = getDirectoryVariants(code);
 
     // 尝试所有可能的目录名称变体
-    for (const dirVariant of directoryVariants) {{
+    for (const dirVariant of directoryVariants) {
       const coverPaths = [
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-thumb.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/${{dirVariant}}-poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/poster.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/cover.jpg`,
-        `${{COVER_DIR}}/${{dirVariant}}/thumb.jpg`
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-thumb.jpg`,
+        `${COVER_DIR}/${dirVariant}/${dirVariant}-poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/poster.jpg`,
+        `${COVER_DIR}/${dirVariant}/cover.jpg`,
+        `${COVER_DIR}/${dirVariant}/thumb.jpg`
       ];
 
-      for (const coverPath of coverPaths) {{
+      for (const coverPath of coverPaths) {
         const candidate = resolveFile(coverPath, p.file.path);
         if (candidate) return candidate;
-      }}
-    }}
-  }}
+      }
+    }
+  }
 
   return null;
-}}
+}
 
 // === 关键词页面所在文件夹 ===
 const KW_DIR = KEYWORDS_DIR;
 
-function kwLinksCell(p){{
+function kwLinksCell(p){
   const raw = p.Keywords;
   let arr = [];
 
   // 统一成数组
-  if (Array.isArray(raw)) {{
+  if (Array.isArray(raw)) {
     arr = raw;
-  }} else if (typeof raw === 'string') {{
+  } else if (typeof raw === 'string') {
     arr = raw.split(/[,，;；、\\s]+/);
-  }} else {{
+  } else {
     arr = [];
-  }}
+  }
 
   // 创建容器元素
   const container = document.createElement('div');
   container.className = 'kw-badges';
 
   // 逐个创建徽章元素
-  arr.forEach(k => {{
+  arr.forEach(k => {
     if (!k) return;
 
     let target, label;
-    if (typeof k === 'object' && k.path) {{
+    if (typeof k === 'object' && k.path) {
       target = k.path;
       label = k.display ?? k.path.split('/').pop();
-    }} else {{
+    } else {
       let t = String(k).trim();
       if (!t) return;
-      if (/^\\[\\[.*\\]\\]$/.test(t)) {{
+      if (/^\\[\\[.*\\]\\]$/.test(t)) {
         // 已经是 [[...]] 格式
         const m = t.match(/^\\[\\[([^\\]#|]+)(?:#[^\\]|]+)?(?:\\|([^\\]]+))?\\]\\]$/);
-        if (m) {{
+        if (m) {
           target = m[1];
           label = m[2] ?? m[1].split('/').pop();
-        }}
-      }} else {{
+        }
+      } else {
         // 普通字符串，添加目录前缀
-        target = KW_DIR ? `${{KW_DIR}}/${{t}}` : t;
+        target = KW_DIR ? `${KW_DIR}/${t}` : t;
         label = t;
-      }}
-    }}
+      }
+    }
 
     // 创建徽章元素
     const badge = document.createElement('span');
@@ -2669,109 +2372,109 @@ function kwLinksCell(p){{
     badge.appendChild(link);
 
     container.appendChild(badge);
-  }});
+  });
 
   return container;
-}}
+}
 
 // === 根据分类类型获取过滤函数 ===
-function filterByCategory(pages) {{
-  if (CATEGORY_TYPE === 'keywords') {{
+function filterByCategory(pages) {
+  if (CATEGORY_TYPE === 'keywords') {
     // 关键词过滤：检查Keywords字段中是否包含当前关键词
-    return pages.where(p => {{
+    return pages.where(p => {
       const keywords = p.Keywords || [];
       // 处理嵌套数组格式: [[- - keyword1], [- - keyword2]]
-      const flattenKeywords = (arr) => {{
+      const flattenKeywords = (arr) => {
         let result = [];
-        for (const item of arr) {{
-          if (Array.isArray(item)) {{
+        for (const item of arr) {
+          if (Array.isArray(item)) {
             result = result.concat(flattenKeywords(item));
-          }} else if (typeof item === 'string') {{
+          } else if (typeof item === 'string') {
             result.push(item);
-          }}
-        }}
+          }
+        }
         return result;
-      }};
+      };
       const keywordArray = flattenKeywords(keywords);
-      return keywordArray.some(kw => {{
-        if (typeof kw === 'object' && kw.path) {{
+      return keywordArray.some(kw => {
+        if (typeof kw === 'object' && kw.path) {
           return kw.path.split('/').pop() === CATEGORY_VALUE;
-        }} else if (typeof kw === 'string') {{
+        } else if (typeof kw === 'string') {
           const cleanKw = kw.replace(/^\\[\\[|\\]\\]$/g, '').split('|').pop().trim();
           return cleanKw === CATEGORY_VALUE;
-        }}
+        }
         return false;
-      }});
-    }});
-  }} else {{
+      });
+    });
+  } else {
     // 其他分类：直接比较字段值
-    if (CATEGORY_TYPE === 'actor') {{
-      return pages.where(p => {{
+    if (CATEGORY_TYPE === 'actor') {
+      return pages.where(p => {
         const actor = p.Actor;
         // 处理Actor字段的不同格式：字符串、数组、嵌套数组
-        if (Array.isArray(actor)) {{
+        if (Array.isArray(actor)) {
           // 处理嵌套数组，如 [["上原瑞穂"]]
-          const flattenActors = (arr) => {{
+          const flattenActors = (arr) => {
             let result = [];
-            for (const item of arr) {{
-              if (Array.isArray(item)) {{
+            for (const item of arr) {
+              if (Array.isArray(item)) {
                 result = result.concat(flattenActors(item));
-              }} else if (typeof item === 'string' && item.trim()) {{
+              } else if (typeof item === 'string' && item.trim()) {
                 result.push(item.trim());
-              }}
-            }}
+              }
+            }
             return result;
-          }};
+          };
           const actorList = flattenActors(actor);
           return actorList.includes(CATEGORY_VALUE);
-        }} else if (actor && typeof actor === 'string') {{
+        } else if (actor && typeof actor === 'string') {
           // 如果是字符串，直接比较
           return actor === CATEGORY_VALUE;
-        }}
+        }
         return false;
-      }});
-    }} else if (CATEGORY_TYPE === 'ranks') {{
+      });
+    } else if (CATEGORY_TYPE === 'ranks') {
       return pages.where(p => p.VideoRank == CATEGORY_VALUE);
-    }} else if (CATEGORY_TYPE === 'series') {{
-      return pages.where(p => {{
+    } else if (CATEGORY_TYPE === 'series') {
+      return pages.where(p => {
         const series = p.Series;
         // 处理Series字段的不同格式：字符串、数组、嵌套数组
-        if (Array.isArray(series)) {{
+        if (Array.isArray(series)) {
           // 处理嵌套数组，如 [["俺だけの尻コス娘"]]
-          const flattenSeries = (arr) => {{
+          const flattenSeries = (arr) => {
             let result = [];
-            for (const item of arr) {{
-              if (Array.isArray(item)) {{
+            for (const item of arr) {
+              if (Array.isArray(item)) {
                 result = result.concat(flattenSeries(item));
-              }} else if (typeof item === 'string' && item.trim()) {{
+              } else if (typeof item === 'string' && item.trim()) {
                 result.push(item.trim());
-              }}
-            }}
+              }
+            }
             return result;
-          }};
+          };
           const seriesList = flattenSeries(series);
           return seriesList.includes(CATEGORY_VALUE);
-        }} else if (series && typeof series === 'string') {{
+        } else if (series && typeof series === 'string') {
           // 如果是字符串，直接比较
           return series === CATEGORY_VALUE;
-        }}
+        }
         return false;
-      }});
-    }} else if (CATEGORY_TYPE === 'years') {{
+      });
+    } else if (CATEGORY_TYPE === 'years') {
       return pages.where(p => p.Year === CATEGORY_VALUE);
-    }} else {{
+    } else {
       return pages.where(p => p[CATEGORY_TYPE.charAt(0).toUpperCase() + CATEGORY_TYPE.slice(1, -1)] === CATEGORY_VALUE);
-    }}
-  }}
-}}
+    }
+  }
+}
 
 // === 输出表格 ===
 dv.table(
   ["Cover", "CN", "JP", "Code", "Actor", "Year", "Time", "Rank", "Keywords"],
-  categoryPages.map(p => {{
+  categoryPages.map(p => {
     const coverFile = findCoverForPage(p);
     const coverHtml = coverFile
-      ? `<img class="myTableImg" src="${{app.vault.adapter.getResourcePath(coverFile.path)}}" loading="lazy">`
+      ? `<img class="myTableImg" src="${app.vault.adapter.getResourcePath(coverFile.path)}" loading="lazy">`
       : `<div class="myTableImg no-cover-placeholder" style="
           width: 100px;
           height: 210px;
@@ -2802,42 +2505,42 @@ dv.table(
     let actorDisplay = "";
 
     // 辅助函数：处理Actor字段的不同格式
-    const getActorList = (actorField) => {{
+    const getActorList = (actorField) => {
       if (!actorField) return [];
-      if (Array.isArray(actorField)) {{
+      if (Array.isArray(actorField)) {
         // 处理嵌套数组，如 [["上原瑞穂"]]
-        const flattenActors = (arr) => {{
+        const flattenActors = (arr) => {
           let result = [];
-          for (const item of arr) {{
-            if (Array.isArray(item)) {{
+          for (const item of arr) {
+            if (Array.isArray(item)) {
               result = result.concat(flattenActors(item));
-            }} else if (typeof item === 'string' && item.trim()) {{
+            } else if (typeof item === 'string' && item.trim()) {
               result.push(item.trim());
-            }}
-          }}
+            }
+          }
           return result;
-        }};
+        };
         return flattenActors(actorField);
-      }} else if (typeof actorField === 'string') {{
+      } else if (typeof actorField === 'string') {
         // 处理逗号分隔的字符串
         return actorField.split(',').map(a => a.trim()).filter(Boolean);
-      }}
+      }
       return [];
-    }};
+    };
 
-    if (CATEGORY_TYPE === 'actor') {{
+    if (CATEGORY_TYPE === 'actor') {
       // 如果是演员页面，需要显示该作品的其他演员
       const allActors = getActorList(p.Actor).filter(a => a !== CATEGORY_VALUE);
-      if (allActors.length > 0) {{
-        actorDisplay = allActors.map(a => `[[${{ACTOR_DIR}}/${{a}}|${{a}}]]`).join(', ');
-      }} else {{
+      if (allActors.length > 0) {
+        actorDisplay = allActors.map(a => `[[${ACTOR_DIR}/${a}|${a}]]`).join(', ');
+      } else {
         actorDisplay = CATEGORY_VALUE; // 如果没有其他演员，显示当前演员
-      }}
-    }} else {{
+      }
+    } else {
       // 如果不是演员页面，正常显示演员
       const actors = getActorList(p.Actor);
-      actorDisplay = actors.map(a => `[[${{ACTOR_DIR}}/${{a}}|${{a}}]]`).join(', ');
-    }}
+      actorDisplay = actors.map(a => `[[${ACTOR_DIR}/${a}|${a}]]`).join(', ');
+    }
 
     return [
       coverHtml,
@@ -2845,17 +2548,213 @@ dv.table(
       "🇯🇵" + " " + (p.JP ?? ""),
       "🪪 " + "[[" + (p.Code ?? "") + "]]",
       "👰 " + actorDisplay,
-      "📅 " + "[[" + (p.Year ? `${{YEARS_DIR}}/${{p.Year}}` : "") + "|" + (p.Year ?? "") + "]]",
+      "📅 " + "[[" + (p.Year ? `${YEARS_DIR}/${p.Year}` : "") + "|" + (p.Year ?? "") + "]]",
       "🕒 " + (p.Time ?? ""),
-      "🌡️ " + "[[" + (p.VideoRank ? `${{RANKS_DIR}}/${{p.VideoRank}}` : "") + "|" + (p.VideoRank ?? "") + "]]",
+      "🌡️ " + "[[" + (p.VideoRank ? `${RANKS_DIR}/${p.VideoRank}` : "") + "|" + (p.VideoRank ?? "") + "]]",
       kwLinksCell(p),
     ];
-  }})
+  })
 );
 
 ```
 """
-        return content
+
+
+# frontmatter中的数组属性，以及各自的嵌套数组项前缀
+_FM_LIST_KEYS = frozenset({'Actor', 'Keywords', 'Series'})
+_FM_ITEM_PREFIX = {'Actor': '- - -', 'Keywords': '- - -', 'Series': '- -'}
+_FM_ITEM_STRIP = {'Actor': ('- - -',), 'Keywords': ('- - -',), 'Series': ('- - -', '- -')}
+
+# 独立分类页面: (分类类型/输出目录, frontmatter属性, 日志中的名称)
+_INDEPENDENT_CATEGORIES = (
+    ('actor', 'Actor', '演员'),
+    ('keywords', 'Keywords', '关键词'),
+    ('ranks', 'VideoRank', '评分'),
+    ('series', 'Series', '系列'),
+    ('years', 'Year', '年份'),
+)
+_INDEPENDENT_CATEGORY_INDEX = {category_type: i for i, (category_type, _, _) in enumerate(_INDEPENDENT_CATEGORIES)}
+
+
+class IndependentCategoryGenerator:
+    """独立的分类页面生成器 - 基于films文件夹的MD文件内容生成分类页面"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.base_dir = Path(config.get('paths.output_directory', 'jav_store')).parent
+        self.films_dir = self.base_dir / 'films'
+        # 各类独立页面的输出目录，构造时统一创建一次
+        self._page_dirs = {category_type: self.base_dir / category_type for category_type, _, _ in _INDEPENDENT_CATEGORIES}
+        for page_dir in self._page_dirs.values():
+            page_dir.mkdir(exist_ok=True)
+        # films文件夹中各MD文件的(文件名, 解析后的frontmatter)，首次使用时加载
+        self._frontmatter_cache = None
+
+    def _load_all_frontmatters(self) -> List[Tuple[str, dict]]:
+        """扫描films文件夹一次，解析每个MD文件的frontmatter并缓存，供各分类页面共用"""
+        if self._frontmatter_cache is not None:
+            return self._frontmatter_cache
+
+        md_files = list(self.films_dir.glob('*.md'))
+
+        # 读取文件是I/O密集型操作，用线程池并行读取
+        max_workers = self.config.get('advanced.max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._load_frontmatter_entry, md_files))
+
+        frontmatters = [(md_file.stem, self._intern_frontmatter(frontmatter))
+                        for md_file, frontmatter in zip(md_files, results) if frontmatter is not None]
+
+        self._frontmatter_cache = frontmatters
+        return frontmatters
+
+    @staticmethod
+    def _intern_frontmatter(frontmatter: dict) -> dict:
+        """驻留frontmatter中的属性值：同一演员/关键词/系列在多部作品中重复出现，缓存期间共用同一个字符串对象"""
+        for key in _FM_LIST_KEYS:
+            frontmatter[key] = [sys.intern(value) for value in frontmatter[key]]
+        frontmatter['VideoRank'] = sys.intern(frontmatter['VideoRank'])
+        frontmatter['Year'] = sys.intern(frontmatter['Year'])
+        return frontmatter
+
+    def _load_frontmatter_entry(self, md_file: Path) -> Optional[dict]:
+        """读取单个MD文件的frontmatter，出错或没有frontmatter时返回None"""
+        try:
+            return self._read_frontmatter(md_file)
+        except Exception as e:
+            logging.warning(f"处理文件 {md_file} 时出错: {e}")
+            return None
+
+    def _read_frontmatter(self, md_file: Path) -> Optional[dict]:
+        """读取并解析单个MD文件的frontmatter，没有frontmatter时返回None"""
+        with open(md_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # 提取frontmatter
+        if content.startswith('---'):
+            frontmatter_end = content.find('---', 3)
+            if frontmatter_end > 0:
+                return self._parse_frontmatter(content[3:frontmatter_end])
+        return None
+
+    def _parse_frontmatter(self, frontmatter_text: str) -> dict:
+        """逐行扫描一次frontmatter，同时提取各分类页面需要的属性"""
+        lists = {'Actor': [], 'Keywords': [], 'Series': []}
+        rank = None
+        year = None
+        section = None  # 当前所在的数组属性（Actor/Keywords/Series）
+
+        for line in frontmatter_text.split('\n'):
+            line = line.strip()
+            key, colon, _ = line.partition(':')
+            if colon and key in _FM_LIST_KEYS:
+                section = key
+                # 处理单行格式：Actor: actor_name
+                value = line.replace(key + colon, '').strip()
+                if value and value not in ['-', '[]']:
+                    lists[key].append(value)
+            elif section is not None and line.startswith(_FM_ITEM_PREFIX[section]):
+                # 处理嵌套数组格式：- - - actor_name（Series也支持 - - series_name）
+                value = line
+                for prefix in _FM_ITEM_STRIP[section]:
+                    value = value.replace(prefix, '')
+                value = value.strip()
+                if value:
+                    lists[section].append(value)
+            elif line and not line.startswith('-') and ':' in line:
+                # 遇到新的字段，结束数组属性解析
+                section = None
+                if rank is None and line.startswith('VideoRank:'):
+                    rank = line.replace('VideoRank:', '').strip()
+                elif year is None and line.startswith('Year:'):
+                    year = line.replace('Year:', '').strip()
+
+        if rank:
+            try:
+                # 统一格式化为一位小数
+                rank = str(round(float(rank), 1))
+            except ValueError:
+                pass
+
+        lists['VideoRank'] = rank or ''
+        lists['Year'] = year or ''
+        return lists
+
+    def collect_all_works(self) -> Tuple[dict, dict, dict, dict, dict]:
+        """遍历一次films文件夹的frontmatter，同时收集演员、关键词、评分、系列、年份对应的作品
+
+        返回值顺序与_INDEPENDENT_CATEGORIES一致
+        """
+        all_works = tuple(defaultdict(list) for _ in _INDEPENDENT_CATEGORIES)
+        list_fields = tuple((works, field) for works, (_, field, _) in zip(all_works, _INDEPENDENT_CATEGORIES)
+                            if field in _FM_LIST_KEYS)
+        scalar_fields = tuple((works, field) for works, (_, field, _) in zip(all_works, _INDEPENDENT_CATEGORIES)
+                              if field not in _FM_LIST_KEYS)
+
+        for stem, frontmatter in self._load_all_frontmatters():
+            for works, field in list_fields:
+                for value in frontmatter[field]:
+                    if value not in _BLOCKED_CATEGORIES:
+                        works[value].append(stem)
+
+            for works, field in scalar_fields:
+                value = frontmatter[field]
+                if value not in _BLOCKED_CATEGORIES:
+                    works[value].append(stem)
+
+        return all_works
+
+    def generate_all_pages(self):
+        """一次遍历收集各分类的作品，再依次生成各类独立页面"""
+        for (category_type, _, _), category_works in zip(_INDEPENDENT_CATEGORIES, self.collect_all_works()):
+            self.generate_category_pages(category_type, category_works)
+
+    def generate_category_pages(self, category_type: str, category_works: Optional[dict] = None):
+        """读取films文件夹中对应的frontmatter属性，为该分类的每个值生成页面"""
+        index = _INDEPENDENT_CATEGORY_INDEX[category_type]
+        label = _INDEPENDENT_CATEGORIES[index][2]
+        logging.info(f"开始独立生成{label}页面...")
+
+        if category_works is None:
+            category_works = self.collect_all_works()[index]
+
+        # 作品列表只在追加作品时创建，每个分类值都至少有一部作品
+        max_workers = self.config.get('advanced.max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(functools.partial(self._generate_page, category_type, label),
+                              category_works.keys(), category_works.values()))
+
+        logging.info(f"已生成 {len(category_works)} 个{label}页面")
+
+    def _generate_page(self, category_type: str, label: str, category_value: str, works: List[str]):
+        """生成单个分类值的页面"""
+        page_file = self._page_dirs[category_type] / f"{category_value}.md"
+        content = self._generate_preview_style_page(category_type, category_value, works)
+
+        _write_text_file(page_file, content)
+        logging.info("已生成%s页面: %s", label, page_file)
+
+    def _generate_preview_style_page(self, category_type: str, category_value: str, works: List[str]) -> str:
+        """生成preview.md样式的分类页面内容"""
+        # 根据分类类型设置标题
+        title = _PREVIEW_PAGE_TITLES.get(category_type, _PREVIEW_PAGE_TITLES['actor']).format(category_value)
+
+        return f"""---
+cssclasses:
+  - cards-cols-6
+  - cards-cover
+  - table-max
+  - cards
+---
+
+# {title}
+
+```dataviewjs
+
+// === 分类专属页面配置 ===
+const CATEGORY_TYPE = "{category_type}";
+const CATEGORY_VALUE = "{category_value}";
+""" + _PREVIEW_PAGE_JS
 
 
 if __name__ == "__main__":
@@ -2,10 +2,78 @@ import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import ParseError
 import logging
 import html
+import json
+import os
+import sqlite3
+import threading
 import unicodedata
 import re
-import tempfile
-import os
+
+# ElementTree是否使用C加速实现（CPython 3.3+默认启用），纯Python实现解析大文件时慢很多
+try:
+    import _elementtree
+    _ET_ACCELERATED = ET.XMLParser is _elementtree.XMLParser
+except ImportError:
+    _ET_ACCELERATED = False
+
+# 标量字段: 数据键 -> NFO标签
+_SCALAR_FIELDS = {
+    'title': 'title',
+    'originaltitle': 'originaltitle',
+    'rating': 'rating',
+    'studio': 'studio',
+    'director': 'director',
+    'maker': 'maker',
+    'publisher': 'publisher',
+    'plot': 'plot',
+    'series': 'series',
+    'runtime': 'runtime'
+}
+
+# 发行日期候选标签，按优先级排列
+_DATE_FIELDS = ('releasedate', 'premiered', 'release')
+
+# 需要保留的根节点子元素，其余元素解析后立即丢弃
+_NFO_TAGS = frozenset(_SCALAR_FIELDS.values()) | frozenset(_DATE_FIELDS) | {'genre', 'actor'}
+
+# 逐行解析用的字段正则: 数据键 -> 预编译的标签正则
+_FIELD_PATTERNS = {
+    field: re.compile(rf'<{tag}[^>]*>(.*?)</{tag}>', re.IGNORECASE | re.DOTALL)
+    for field, tag in (
+        ('title', 'title'),
+        ('studio', 'studio'),
+        ('director', 'director'),
+        ('plot', 'plot'),
+        ('release_date', 'releasedate'),
+        ('series', 'series'),
+        ('runtime', 'runtime'),
+        ('rating', 'rating'),
+    )
+}
+_GENRE_RE = re.compile(r'<genre[^>]*>(.*?)</genre>', re.IGNORECASE)
+_ACTOR_NAME_RE = re.compile(r'<actor[^>]*>.*?<name[^>]*>(.*?)</name>.*?</actor>', re.DOTALL)
+
+# XML修复用的正则
+_INVALID_XML_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F]')
+_BARE_AMP_RE = re.compile(r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)')
+
+
+class _ControlCharTable(dict):
+    """str.translate用的映射表：控制类字符（Unicode类别C*）映射为None，其余字符映射为自身
+
+    按需计算并缓存每个码位的结果，不必预先为全部码位建表
+    """
+
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint))[0] == 'C' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_CTRL_TABLE = _ControlCharTable()
+
+# NFO解析缓存的格式版本，解析逻辑或结果结构变化时递增，旧版本的缓存项在打开时整体清空
+_CACHE_VERSION = 1
 
 class FixedNFOParser:
     """修复版NFO文件解析器"""
@@ -18,105 +86,212 @@ class FixedNFOParser:
             'director': '未知',
             'plot': '暂无该部分信息'
         })
-
-    def parse_nfo(self, nfo_path: str) -> dict:
-        """解析NFO文件，完全重写版本"""
-        logging.info(f"开始解析NFO文件: {nfo_path}")
-
-        # 初始化数据结构
-        data = {
+        # 解析结果的初始数据只依赖配置，构造时生成一次，每次解析复制后使用
+        self._data_template = {
             'title': '',
             'actors': [],
             'release_date': '',
             'rating': self.defaults.get('rating', 0.0),
             'plot': self.defaults.get('plot', '暂无该部分信息'),
-            'genre': [],  # 确保初始化
+            'genre': [],
             'studio': self.defaults.get('studio', '未知'),
             'director': self.defaults.get('director', '未知'),
             'maker': self.defaults.get('maker', '未知'),
             'publisher': self.defaults.get('publisher', '未知'),
             'series': ''
         }
+        # 判断是否解析出有效数据时对比的默认剧情
+        self._plot_default = self.defaults.get('plot', '')
+
+        # 跨运行复用的解析结果缓存（SQLite），按(路径, 修改时间, 文件大小)命中；配置为空字符串时禁用
+        # 默认放在输出目录的上一级（jav_store/.nfo_cache.sqlite）
+        default_cache_file = os.path.join(
+            os.path.dirname(config.get('paths.output_directory', 'obsidian_output')), '.nfo_cache.sqlite')
+        self.cache_file = config.get('nfo_parsing.cache_file', default_cache_file)
+        # 默认值不同时解析结果也不同，缓存项要求默认值一致才能复用
+        self._cache_defaults = json.dumps(self._data_template, ensure_ascii=False, sort_keys=True)
+        self._cache_conn = None
+        self._cache_pid = None
+        self._cache_lock = threading.Lock()
+        if not _ET_ACCELERATED:
+            logging.warning("xml.etree.ElementTree未使用C加速实现，NFO解析速度会明显下降")
+
+    def __getstate__(self):
+        # 数据库连接和锁不能跨进程传递，在子进程中首次使用时重新创建
+        state = self.__dict__.copy()
+        state['_cache_conn'] = None
+        state['_cache_pid'] = None
+        del state['_cache_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    def parse_nfo(self, nfo_path: str) -> dict:
+        """解析NFO文件，文件未变化时直接返回缓存中的解析结果"""
+        try:
+            st = os.stat(nfo_path)
+        except OSError:
+            return self._parse_nfo_uncached(nfo_path)[0]
+
+        key = os.path.abspath(nfo_path)
+        cached = self._cache_get(key, st.st_mtime_ns, st.st_size)
+        if cached is not None:
+            logging.debug("使用缓存的NFO解析结果: %s", nfo_path)
+            return cached
+
+        data, parsed = self._parse_nfo_uncached(nfo_path)
+        # 解析失败（包括文件暂时无法读取）时只返回默认数据，不写入缓存，下次运行重新解析
+        if parsed:
+            self._cache_put(key, st.st_mtime_ns, st.st_size, data)
+        return data
+
+    def _cache_connection(self):
+        """获取当前进程的缓存数据库连接，缓存不可用时返回None"""
+        if not self.cache_file:
+            return None
+        # fork出的子进程不能沿用父进程的连接
+        if self._cache_conn is None or self._cache_pid != os.getpid():
+            try:
+                conn = sqlite3.connect(self.cache_file, timeout=30, check_same_thread=False)
+                # 缓存内容可随时重建，不需要每次提交都落盘
+                conn.execute('PRAGMA synchronous=OFF')
+                # 缓存版本不一致时丢弃旧表
+                if conn.execute('PRAGMA user_version').fetchone()[0] != _CACHE_VERSION:
+                    conn.execute('DROP TABLE IF EXISTS nfo_cache')
+                    conn.execute(f'PRAGMA user_version = {_CACHE_VERSION}')
+                conn.execute('CREATE TABLE IF NOT EXISTS nfo_cache ('
+                             'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, defaults TEXT, data TEXT)')
+                conn.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"无法打开NFO解析缓存 {self.cache_file}，本次运行不使用缓存: {e}")
+                self.cache_file = None
+                return None
+            self._cache_conn = conn
+            self._cache_pid = os.getpid()
+        return self._cache_conn
+
+    def _cache_get(self, key: str, mtime_ns: int, size: int):
+        """读取缓存的解析结果，文件或默认值有变化时返回None"""
+        with self._cache_lock:
+            conn = self._cache_connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute('SELECT mtime_ns, size, defaults, data FROM nfo_cache WHERE path = ?',
+                                   (key,)).fetchone()
+                if row and row[0] == mtime_ns and row[1] == size and row[2] == self._cache_defaults:
+                    return json.loads(row[3])
+            except (sqlite3.Error, ValueError) as e:
+                logging.debug("读取NFO解析缓存失败: %s - %s", key, e)
+            return None
+
+    def _cache_put(self, key: str, mtime_ns: int, size: int, data: dict):
+        """写入解析结果，写入失败不影响解析"""
+        with self._cache_lock:
+            conn = self._cache_connection()
+            if conn is None:
+                return
+            try:
+                conn.execute('INSERT OR REPLACE INTO nfo_cache VALUES (?, ?, ?, ?, ?)',
+                             (key, mtime_ns, size, self._cache_defaults, json.dumps(data, ensure_ascii=False)))
+                conn.commit()
+            except sqlite3.Error as e:
+                logging.debug("写入NFO解析缓存失败: %s - %s", key, e)
+
+    def _parse_nfo_uncached(self, nfo_path: str) -> tuple:
+        """解析NFO文件，完全重写版本
+
+        返回(解析结果, 是否解析成功)，所有解析方法都失败时解析结果为默认数据
+        """
+        logging.info("开始解析NFO文件: %s", nfo_path)
+
+        # 初始化数据结构（列表字段重新创建，不与模板共用）
+        data = {**self._data_template, 'actors': [], 'genre': []}
 
-        # 尝试多种解析方法
-        parsers = [
-            self._parse_standard_xml,
-            self._parse_with_recovery,
-            self._parse_line_by_line,
-            self._parse_with_minidom
+        # 常见情况：标准XML解析直接成功
+        try:
+            result = self._parse_standard_xml(nfo_path, data)
+            if self._has_meaningful_data(result):
+                logging.info("使用方法 1 成功解析: %s", nfo_path)
+                return result, True
+        except Exception as e:
+            logging.warning(f"解析方法 1 失败: {nfo_path} - {e}")
+
+        # 回退方法共用一次读取的文件内容
+        try:
+            with open(nfo_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError as e:
+            logging.warning(f"所有解析方法都失败: {nfo_path} - {e}")
+            return data, False
+
+        fallbacks = [
+            (2, lambda: self._parse_with_recovery(nfo_path, content, data)),
+            (3, lambda: self._parse_line_by_line(content, data))
         ]
 
-        for i, parser in enumerate(parsers, 1):
+        for i, parser in fallbacks:
             try:
-                logging.debug(f"尝试解析方法 {i}: {nfo_path}")
-                result = parser(nfo_path, data)
-                if result and self._has_meaningful_data(result):
-                    logging.info(f"使用方法 {i} 成功解析: {nfo_path}")
-                    return result
+                logging.debug("尝试解析方法 %s: %s", i, nfo_path)
+                result = parser()
+                if self._has_meaningful_data(result):
+                    logging.info("使用方法 %s 成功解析: %s", i, nfo_path)
+                    return result, True
             except Exception as e:
                 logging.warning(f"解析方法 {i} 失败: {nfo_path} - {e}")
-                continue
 
         logging.warning(f"所有解析方法都失败: {nfo_path}")
-        return data
+        return data, False
 
     def _has_meaningful_data(self, data: dict) -> bool:
-        """检查是否有有意义的数据"""
-        return any([
-            data.get('title', '').strip(),
-            data.get('studio', '').strip() != '未知',
-            data.get('director', '').strip() != '未知',
-            data.get('plot', '').strip() != self.defaults.get('plot', ''),
-            data.get('rating', 0) > 0,
-            len(data.get('actors', [])) > 0,
-            len(data.get('genre', [])) > 0,
-            data.get('release_date', '').strip()
-        ])
+        """检查是否有有意义的数据（按顺序短路判断，大多数NFO在标题处即返回）"""
+        return bool(
+            data.get('title', '').strip()
+            or data.get('studio', '').strip() != '未知'
+            or data.get('director', '').strip() != '未知'
+            or data.get('plot', '').strip() != self._plot_default
+            or data.get('rating', 0) > 0
+            or data.get('actors')
+            or data.get('genre')
+            or data.get('release_date', '').strip()
+        )
 
     def _parse_standard_xml(self, nfo_path: str, data: dict) -> dict:
-        """标准XML解析"""
-        tree = ET.parse(nfo_path)
-        root = tree.getroot()
+        """标准XML解析（流式读取，只保留需要提取的元素）"""
+        context = ET.iterparse(nfo_path, events=('start', 'end'))
+        _, root = next(context)
+        depth = 1
+        for event, elem in context:
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            # 根节点的直接子元素已完整解析，丢弃不需要的元素以控制内存
+            if depth == 1 and elem.tag not in _NFO_TAGS:
+                root.remove(elem)
         return self._extract_data_safe(root, data)
 
-    def _parse_with_recovery(self, nfo_path: str, data: dict) -> dict:
-        """带恢复的XML解析"""
-        with open(nfo_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
+    def _parse_with_recovery(self, nfo_path: str, content: str, data: dict) -> dict:
+        """带恢复的XML解析，content为已读取的文件内容"""
         # 修复常见的XML问题
         content = self._fix_xml_issues(content)
 
-        # 使用临时文件
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.nfo', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-
-        try:
-            tree = ET.parse(temp_file_path)
-            root = tree.getroot()
-            result = self._extract_data_safe(root, data)
-            logging.info(f"修复解析成功: {nfo_path}")
-            return result
-        finally:
-            os.unlink(temp_file_path)
-
-    def _parse_line_by_line(self, nfo_path: str, data: dict) -> dict:
-        """逐行解析NFO文件"""
-        with open(nfo_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # 直接在内存中解析修复后的内容（按UTF-8编码，与原先写入临时文件再解析的字节一致）
+        root = ET.fromstring(content.encode('utf-8'))
+        result = self._extract_data_safe(root, data)
+        logging.info("修复解析成功: %s", nfo_path)
+        return result
 
+    def _parse_line_by_line(self, content: str, data: dict) -> dict:
+        """逐行解析NFO文件内容"""
         # 使用正则表达式提取数据
-        data['title'] = self._extract_field(content, r'<title[^>]*>(.*?)</title>')
-        data['studio'] = self._extract_field(content, r'<studio[^>]*>(.*?)</studio>')
-        data['director'] = self._extract_field(content, r'<director[^>]*>(.*?)</director>')
-        data['plot'] = self._extract_field(content, r'<plot[^>]*>(.*?)</plot>')
-        data['release_date'] = self._extract_field(content, r'<releasedate[^>]*>(.*?)</releasedate>')
-        data['series'] = self._extract_field(content, r'<series[^>]*>(.*?)</series>')
-        data['runtime'] = self._extract_field(content, r'<runtime[^>]*>(.*?)</runtime>')
+        for field in ('title', 'studio', 'director', 'plot', 'release_date', 'series', 'runtime'):
+            data[field] = self._extract_field(content, _FIELD_PATTERNS[field])
 
         # 提取评分
-        rating_text = self._extract_field(content, r'<rating[^>]*>(.*?)</rating>')
+        rating_text = self._extract_field(content, _FIELD_PATTERNS['rating'])
         if rating_text:
             try:
                 data['rating'] = float(rating_text)
@@ -124,71 +299,48 @@ class FixedNFOParser:
                 pass
 
         # 提取类型
-        genre_matches = re.findall(r'<genre[^>]*>(.*?)</genre>', content, re.IGNORECASE)
+        genre_matches = _GENRE_RE.findall(content)
         data['genre'] = [self._clean_text(g) for g in genre_matches if g.strip()]
 
         # 提取演员
-        actor_matches = re.findall(r'<actor[^>]*>.*?<name[^>]*>(.*?)</name>.*?</actor>', content, re.DOTALL)
+        actor_matches = _ACTOR_NAME_RE.findall(content)
         data['actors'] = [self._clean_text(a) for a in actor_matches if a.strip()]
 
         return data
 
-    def _parse_with_minidom(self, nfo_path: str, data: dict) -> dict:
-        """使用minidom解析（备用方案）"""
-        try:
-            from xml.dom import minidom
-            doc = minidom.parse(nfo_path)
-
-            # 提取数据
-            for elem in doc.getElementsByTagName('title'):
-                if elem.firstChild:
-                    data['title'] = elem.firstChild.nodeValue
-                    break
-
-            for elem in doc.getElementsByTagName('studio'):
-                if elem.firstChild:
-                    data['studio'] = elem.firstChild.nodeValue
-                    break
-
-            for elem in doc.getElementsByTagName('series'):
-                if elem.firstChild:
-                    data['series'] = elem.firstChild.nodeValue
-                    break
-
-            # 其他字段类似...
-            return data
-
-        except ImportError:
-            raise Exception("minidom不可用")
-        except Exception as e:
-            raise Exception(f"minidom解析失败: {e}")
-
-    def _extract_field(self, content: str, pattern: str) -> str:
-        """提取单个字段"""
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    def _extract_field(self, content: str, pattern: re.Pattern) -> str:
+        """用预编译的正则提取单个字段"""
+        match = pattern.search(content)
         if match:
             return self._clean_text(match.group(1))
         return ''
 
     def _extract_data_safe(self, root, data: dict) -> dict:
-        """安全的数据提取"""
+        """安全的数据提取（只遍历一次根节点的子元素）"""
         try:
+            # 一次遍历：类型、演员直接收集，标量和日期字段只记录每个标签的第一个元素（与find一致）
+            first_elems = {}
+            genres = []
+            actors = []
+            for child in root:
+                tag = child.tag
+                if tag == 'genre':
+                    if child.text:
+                        genre = self._clean_text(child.text)
+                        if genre:
+                            genres.append(genre)
+                elif tag == 'actor':
+                    name_elem = child.find('name')
+                    if name_elem is not None and name_elem.text:
+                        actor = self._clean_text(name_elem.text)
+                        if actor:
+                            actors.append(actor)
+                elif tag not in first_elems:
+                    first_elems[tag] = child
+
             # 提取基本信息
-            fields = {
-                'title': 'title',
-                'originaltitle': 'originaltitle',
-                'rating': 'rating',
-                'studio': 'studio',
-                'director': 'director',
-                'maker': 'maker',
-                'publisher': 'publisher',
-                'plot': 'plot',
-                'series': 'series',
-                'runtime': 'runtime'
-            }
-
-            for field_name, tag_name in fields.items():
-                elem = root.find(tag_name)
+            for field_name, tag_name in _SCALAR_FIELDS.items():
+                elem = first_elems.get(tag_name)
                 if elem is not None and elem.text:
                     value = self._clean_text(elem.text)
                     if value:
@@ -201,24 +353,12 @@ class FixedNFOParser:
                             data[field_name] = value
 
             # 提取列表字段
-            data['genre'] = []
-            for genre_elem in root.findall('genre'):
-                if genre_elem.text:
-                    genre = self._clean_text(genre_elem.text)
-                    if genre:
-                        data['genre'].append(genre)
-
-            data['actors'] = []
-            for actor_elem in root.findall('actor'):
-                name_elem = actor_elem.find('name')
-                if name_elem is not None and name_elem.text:
-                    actor = self._clean_text(name_elem.text)
-                    if actor:
-                        data['actors'].append(actor)
+            data['genre'] = genres
+            data['actors'] = actors
 
             # 提取日期
-            for date_field in ['releasedate', 'premiered', 'release']:
-                elem = root.find(date_field)
+            for date_field in _DATE_FIELDS:
+                elem = first_elems.get(date_field)
                 if elem is not None and elem.text:
                     data['release_date'] = self._clean_text(elem.text)
                     break
@@ -239,21 +379,20 @@ class FixedNFOParser:
             text = html.unescape(text)
 
             # 移除控制字符
-            text = ''.join(char for char in text if unicodedata.category(char)[0] != 'C')
-
-            # 清理空白字符
-            text = re.sub(r'\s+', ' ', text)
+            text = text.translate(_CTRL_TABLE)
 
-            return text.strip()
+            # 清理空白字符：连续空白合并为一个空格并去掉首尾空白（与re的\s使用同一空白定义）
+            return ' '.join(text.split())
         except Exception:
             return text.strip()
 
     def _fix_xml_issues(self, content: str) -> str:
         """修复XML问题"""
         # 移除无效字符
-        content = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F]', '', content)
+        content = _INVALID_XML_CHARS_RE.sub('', content)
 
         # 修复常见的XML问题
-        content = re.sub(r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)', '&amp;', content)
+        content = _BARE_AMP_RE.sub('&amp;', content)
+
+        return content
 
-        return content
\ No newline at end of file